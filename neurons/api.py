@@ -230,8 +230,9 @@ class neuron:
             else decoded_data
         )
 
-        # Hash the original data to avoid data confusion
-        content_id = generate_cid_string(decoded_data)
+        # Hash the original data to avoid data confusion. Hashing and encryption are
+        # CPU bound, so run them off the event loop to keep serving other requests.
+        content_id = await asyncio.to_thread(generate_cid_string, decoded_data)
 
         # Check and see if hash already exists, reject if so.
         if await get_ordered_metadata(content_id, self.database):
@@ -239,9 +240,10 @@ class neuron:
             synapse.data_hash = content_id
             return synapse
 
-        validator_encrypted_data, validator_encryption_payload = encrypt_data(
-            decoded_data, self.encryption_wallet
-        )
+        (
+            validator_encrypted_data,
+            validator_encryption_payload,
+        ) = await asyncio.to_thread(encrypt_data, decoded_data, self.encryption_wallet)
 
         if isinstance(validator_encryption_payload, dict):
             validator_encryption_payload = json.dumps(validator_encryption_payload)
@@ -324,7 +326,8 @@ class neuron:
         bt.logging.debug(
             f"validator_encryption_payload: {validator_encryption_payload}"
         )
-        decrypted_data = decrypt_data_with_private_key(
+        decrypted_data = await asyncio.to_thread(
+            decrypt_data_with_private_key,
             validator_encrypted_data,
             bytes(json.dumps(validator_encryption_payload), "utf-8"),
             bytes(self.encryption_wallet.coldkey.private_key.hex(), "utf-8"),
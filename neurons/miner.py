@@ -57,7 +57,7 @@ from storage.miner import (
 from storage.miner.utils import (
     compute_subsequent_commitment,
     save_data_to_filesystem,
-    load_from_filesystem,
+    map_from_filesystem,
     commit_data_with_seed,
     init_wandb,
     update_storage_stats,
@@ -166,6 +166,7 @@ class miner:
         )  # Make sure not to sync without passing subtensor
         self.metagraph.sync(subtensor=self.subtensor)  # Sync metagraph with subtensor.
         bt.logging.debug(str(self.metagraph))
+        self._hotkey_uids, self._hotkey_uids_block = {}, None
 
         # Setup database
         bt.logging.info("loading database")
@@ -315,6 +316,21 @@ class miner:
             total_size += size
         return total_size
 
+    def hotkey_uids(self) -> Dict[str, int]:
+        """
+        Returns a mapping of every hotkey in the metagraph to its uid.
+
+        The blacklist and priority functions run on every incoming request, so the mapping is
+        built once per metagraph block instead of scanning the hotkey list on each call.
+        """
+        block = int(self.metagraph.block)
+        if self._hotkey_uids_block != block:
+            self._hotkey_uids = {
+                hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+            }
+            self._hotkey_uids_block = block
+        return self._hotkey_uids
+
     def store_blacklist_fn(
         self, synapse: storage.protocol.Store
     ) -> typing.Tuple[bool, str]:
@@ -363,7 +379,7 @@ class miner:
             reason = f"Caller {caller} rate limited. Exceeded {window} requests in {blocks} blocks."
             return True, reason
 
-        if caller not in self.metagraph.hotkeys:
+        if caller not in self.hotkey_uids():
             bt.logging.trace(f"Blacklisting unrecognized hotkey {caller}")
             return True, "Unrecognized hotkey"
 
@@ -391,9 +407,8 @@ class miner:
         This method is used within the network's request handling mechanism to allocate
         resources and processing time based on the stake-based priority of each request.
         """
-        caller_uid = self.metagraph.hotkeys.index(
-            synapse.dendrite.hotkey
-        )  # Get the caller index.
+        # Get the caller index.
+        caller_uid = self.hotkey_uids()[synapse.dendrite.hotkey]
         prirority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
@@ -450,7 +465,7 @@ class miner:
             reason = f"Caller {caller} rate limited. Exceeded {window} requests in {blocks} blocks."
             return True, reason
 
-        if caller not in self.metagraph.hotkeys:
+        if caller not in self.hotkey_uids():
             bt.logging.trace(f"Blacklisting unrecognized hotkey {caller}")
             return True, "Unrecognized hotkey"
 
@@ -478,9 +493,8 @@ class miner:
         This method is used within the network's request handling mechanism to allocate
         resources and processing time based on the stake-based priority of each request.
         """
-        caller_uid = self.metagraph.hotkeys.index(
-            synapse.dendrite.hotkey
-        )  # Get the caller index.
+        # Get the caller index.
+        caller_uid = self.hotkey_uids()[synapse.dendrite.hotkey]
         prirority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
@@ -537,7 +551,7 @@ class miner:
             reason = f"Caller {caller} rate limited. Exceeded {window} requests in {blocks} blocks."
             return True, reason
 
-        if caller not in self.metagraph.hotkeys:
+        if caller not in self.hotkey_uids():
             bt.logging.trace(f"Blacklisting unrecognized hotkey {caller}")
             return True, "Unrecognized hotkey"
 
@@ -565,9 +579,8 @@ class miner:
         This method is used within the network's request handling mechanism to allocate
         resources and processing time based on the stake-based priority of each request.
         """
-        caller_uid = self.metagraph.hotkeys.index(
-            synapse.dendrite.hotkey
-        )  # Get the caller index.
+        # Get the caller index.
+        caller_uid = self.hotkey_uids()[synapse.dendrite.hotkey]
         prirority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
@@ -637,7 +650,7 @@ class miner:
             data_hash,
             filepath,
             synapse.dendrite.hotkey,
-            sys.getsizeof(encrypted_byte_data),
+            len(encrypted_byte_data),
             synapse.seed,
             synapse.ttl,
         )
@@ -759,9 +772,9 @@ class miner:
                         f"challenge() File found for {synapse.challenge_hash} in {filepath}."
                     )
 
-        bt.logging.trace("entering load_from_filesystem()")
+        bt.logging.trace("entering map_from_filesystem()")
         try:
-            encrypted_data_bytes = load_from_filesystem(filepath)
+            encrypted_data_bytes = map_from_filesystem(filepath)
         except Exception as e:
             bt.logging.error(f"Error loading file {filepath}: {e}")
             synapse.axon.status_code = 404
@@ -816,7 +829,7 @@ class miner:
         randomness, chunks, commitments, merkle_tree = commit_data_with_seed(
             committer,
             data_chunks=data_chunks,
-            n_chunks=sys.getsizeof(encrypted_data_bytes) // synapse.chunk_size + 1,
+            n_chunks=-(-len(encrypted_data_bytes) // synapse.chunk_size),
             seed=synapse.seed,
         )
 
@@ -917,9 +930,9 @@ class miner:
                         f"retrieve() File found for {synapse.data_hash} in {filepath}."
                     )
 
-        bt.logging.trace("entering load_from_filesystem()")
+        bt.logging.trace("entering map_from_filesystem()")
         try:
-            encrypted_data_bytes = load_from_filesystem(filepath)
+            encrypted_data_bytes = map_from_filesystem(filepath)
         except Exception as e:
             bt.logging.error(f"Error loading file {filepath}: {e}")
             synapse.axon.status_code = 404
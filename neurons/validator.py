@@ -188,6 +188,7 @@ class neuron:
         self.wandb = None
 
         self.prev_step_block = get_current_block(self.subtensor)
+        self.last_compute_stats_block = self.prev_step_block
         self.step = 0
 
         # Start with 0 monitor pings
@@ -205,6 +206,101 @@ class neuron:
         )
         self.last_purged_epoch = 0
 
+    async def run_async(self):
+        """
+        Runs validator steps on the validator's long-lived event loop, waiting for new
+        blocks with non-blocking sleeps so forwards and step bookkeeping share one loop.
+        """
+        while 1:
+            start_epoch = time.time()
+
+            self.metagraph.sync(subtensor=self.subtensor)
+            prev_set_weights_block = self.metagraph.last_update[
+                self.my_subnet_uid
+            ].item()
+
+            # --- Wait until next step epoch.
+            current_block = self.subtensor.get_current_block()
+            while current_block - self.prev_step_block < 3:
+                # --- Wait for next block.
+                await asyncio.sleep(1)
+                current_block = self.subtensor.get_current_block()
+
+            await asyncio.sleep(5)
+            if self.wallet.hotkey.ss58_address not in self.metagraph.hotkeys:
+                raise Exception(
+                    f"Validator is not registered - hotkey {self.wallet.hotkey.ss58_address} not in metagraph"
+                )
+
+            bt.logging.info(
+                f"step({self.step}) block({get_current_block(self.subtensor)})"
+            )
+
+            # Run multiple forwards.
+            coroutines = [
+                forward(self) for _ in range(self.config.neuron.num_concurrent_forwards)
+            ]
+            await asyncio.gather(*coroutines)
+
+            # Init wandb.
+            if not self.config.wandb.off and self.wandb is not None:
+                bt.logging.debug("loading wandb")
+                init_wandb(self)
+
+            # Resync the network state
+            bt.logging.info("Checking if should checkpoint")
+            current_block = get_current_block(self.subtensor)
+            should_checkpoint_validator = should_checkpoint(
+                current_block,
+                self.prev_step_block,
+                self.config.neuron.checkpoint_block_length,
+            )
+            bt.logging.debug(
+                f"should_checkpoint() params: (current block) {current_block} (prev block) {self.prev_step_block} (checkpoint_block_length) {self.config.neuron.checkpoint_block_length}"
+            )
+            bt.logging.debug(f"should checkpoint ? {should_checkpoint_validator}")
+            if should_checkpoint_validator:
+                bt.logging.info("Checkpointing...")
+                checkpoint(self)
+
+            # Set the weights on chain.
+            bt.logging.info("Checking if should set weights")
+            validator_should_set_weights = should_set_weights(
+                get_current_block(self.subtensor),
+                prev_set_weights_block,
+                360,  # tempo
+                self.config.neuron.disable_set_weights,
+            )
+            bt.logging.debug(
+                f"Should validator check weights? -> {validator_should_set_weights}"
+            )
+            if validator_should_set_weights:
+                bt.logging.debug(f"Setting weights {self.moving_averaged_scores}")
+                event = set_weights_for_validator(
+                    subtensor=self.subtensor,
+                    wallet=self.wallet,
+                    metagraph=self.metagraph,
+                    netuid=self.config.netuid,
+                    moving_averaged_scores=self.moving_averaged_scores,
+                    wandb_on=self.config.wandb.on,
+                )
+                prev_set_weights_block = get_current_block(self.subtensor)
+                save_state(self)
+
+                if event is not None:
+                    log_event(self, event)
+
+            # Rollover wandb to a new run.
+            if should_reinit_wandb(self):
+                bt.logging.info("Reinitializing wandb")
+                reinit_wandb(self)
+
+            self.prev_step_block = get_current_block(self.subtensor)
+            if self.config.neuron.verbose:
+                bt.logging.debug(f"block at end of step: {self.prev_step_block}")
+                bt.logging.debug(f"Step took {time.time() - start_epoch} seconds")
+            self.step += 1
+
     def run(self):
         bt.logging.info("run()")
 
@@ -215,100 +311,7 @@ class neuron:
         self.run_subscription_thread()
 
         try:
-            while 1:
-                start_epoch = time.time()
-
-                self.metagraph.sync(subtensor=self.subtensor)
-                prev_set_weights_block = self.metagraph.last_update[
-                    self.my_subnet_uid
-                ].item()
-
-                # --- Wait until next step epoch.
-                current_block = self.subtensor.get_current_block()
-                while current_block - self.prev_step_block < 3:
-                    # --- Wait for next block.
-                    time.sleep(1)
-                    current_block = self.subtensor.get_current_block()
-
-                time.sleep(5)
-                if self.wallet.hotkey.ss58_address not in self.metagraph.hotkeys:
-                    raise Exception(
-                        f"Validator is not registered - hotkey {self.wallet.hotkey.ss58_address} not in metagraph"
-                    )
-
-                bt.logging.info(
-                    f"step({self.step}) block({get_current_block(self.subtensor)})"
-                )
-
-                # Run multiple forwards.
-                async def run_forward():
-                    coroutines = [
-                        forward(self)
-                        for _ in range(self.config.neuron.num_concurrent_forwards)
-                    ]
-                    await asyncio.gather(*coroutines)
-
-                self.loop.run_until_complete(run_forward())
-
-                # Init wandb.
-                if not self.config.wandb.off and self.wandb is not None:
-                    bt.logging.debug("loading wandb")
-                    init_wandb(self)
-
-                # Resync the network state
-                bt.logging.info("Checking if should checkpoint")
-                current_block = get_current_block(self.subtensor)
-                should_checkpoint_validator = should_checkpoint(
-                    current_block,
-                    self.prev_step_block,
-                    self.config.neuron.checkpoint_block_length,
-                )
-                bt.logging.debug(
-                    f"should_checkpoint() params: (current block) {current_block} (prev block) {self.prev_step_block} (checkpoint_block_length) {self.config.neuron.checkpoint_block_length}"
-                )
-                bt.logging.debug(f"should checkpoint ? {should_checkpoint_validator}")
-                if should_checkpoint_validator:
-                    bt.logging.info("Checkpointing...")
-                    checkpoint(self)
-
-                # Set the weights on chain.
-                bt.logging.info("Checking if should set weights")
-                validator_should_set_weights = should_set_weights(
-                    get_current_block(self.subtensor),
-                    prev_set_weights_block,
-                    360,  # tempo
-                    self.config.neuron.disable_set_weights,
-                )
-                bt.logging.debug(
-                    f"Should validator check weights? -> {validator_should_set_weights}"
-                )
-                if validator_should_set_weights:
-                    bt.logging.debug(f"Setting weights {self.moving_averaged_scores}")
-                    event = set_weights_for_validator(
-                        subtensor=self.subtensor,
-                        wallet=self.wallet,
-                        metagraph=self.metagraph,
-                        netuid=self.config.netuid,
-                        moving_averaged_scores=self.moving_averaged_scores,
-                        wandb_on=self.config.wandb.on,
-                    )
-                    prev_set_weights_block = get_current_block(self.subtensor)
-                    save_state(self)
-
-                    if event is not None:
-                        log_event(self, event)
-
-                # Rollover wandb to a new run.
-                if should_reinit_wandb(self):
-                    bt.logging.info("Reinitializing wandb")
-                    reinit_wandb(self)
-
-                self.prev_step_block = get_current_block(self.subtensor)
-                if self.config.neuron.verbose:
-                    bt.logging.debug(f"block at end of step: {self.prev_step_block}")
-                    bt.logging.debug(f"Step took {time.time() - start_epoch} seconds")
-                self.step += 1
-
+            self.loop.run_until_complete(self.run_async())
         except Exception as err:
             bt.logging.error("Error in training loop", str(err))
             bt.logging.debug(print_exception(type(err), err, err.__traceback__))
@@ -1,3 +1,3 @@
-from .store_api import StoreUserAPI, store
+from .store_api import StoreUserAPI, store, store_many
 from .retrieve_api import RetrieveUserAPI, retrieve
-from .utils import get_query_api_axons
\ No newline at end of file
+from .utils import get_metagraph, get_query_api_axons, get_subtensor
\ No newline at end of file
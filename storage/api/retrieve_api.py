@@ -17,13 +17,12 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import torch
 import base64
 import bittensor as bt
 from typing import Any, List, Union
 from storage.protocol import RetrieveUser
 from storage.validator.encryption import decrypt_data_with_private_key
-from storage.api.utils import get_query_api_axons
+from storage.api.utils import get_metagraph, get_query_api_axons, get_subtensor
 
 
 class RetrieveUserAPI(bt.SubnetsAPI):
@@ -84,13 +83,18 @@ async def retrieve(
 ) -> bytes:
     retrieve_handler = RetrieveUserAPI(wallet)
 
-    subtensor = subtensor or bt.subtensor(chain_endpoint)
-    metagraph = subtensor.metagraph(netuid=netuid)
+    subtensor = subtensor or get_subtensor(chain_endpoint)
+    metagraph = get_metagraph(subtensor, netuid=netuid)
 
     if uids is None and hotkeys is not None:
         uids = [metagraph.hotkeys.index(hotkey) for hotkey in hotkeys]
 
-    axons = await get_query_api_axons(wallet=wallet, metagraph=metagraph, uids=uids)
+    axons = await get_query_api_axons(
+        wallet=wallet,
+        metagraph=metagraph,
+        uids=uids,
+        dendrite=retrieve_handler.dendrite,
+    )
 
     data = await retrieve_handler(
         axons=axons,
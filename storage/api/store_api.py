@@ -17,16 +17,15 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import torch
 import base64
 import random
+import asyncio
 import bittensor as bt
-from abc import ABC, abstractmethod
 from typing import Any, List, Union
 from storage.protocol import StoreUser
 from storage.validator.cid import generate_cid_string
 from storage.validator.encryption import encrypt_data
-from storage.api.utils import get_query_api_axons
+from storage.api.utils import get_metagraph, get_query_api_axons, get_subtensor
 
 
 class StoreUserAPI(bt.SubnetsAPI):
@@ -119,26 +118,74 @@ async def store(
         str: The CID of the stored data.
         hotkeys: The hotkeys of the successfully stored data.
     """
+    ((cid, hotkeys),) = await store_many(
+        [data],
+        wallet,
+        subtensor=subtensor,
+        chain_endpoint=chain_endpoint,
+        netuid=netuid,
+        ttl=ttl,
+        encrypt=encrypt,
+        encoding=encoding,
+        timeout=timeout,
+        uid=uid,
+    )
+
+    return cid, hotkeys
+
+
+async def store_many(
+    datas: List[bytes],
+    wallet: "bt.wallet",
+    subtensor: "bt.subtensor" = None,
+    chain_endpoint: str = "finney",
+    netuid: int = 21,
+    ttl: int = 60 * 60 * 24 * 30,
+    encrypt: bool = False,
+    encoding: str = "utf-8",
+    timeout: int = 60,
+    uid: int = None,
+    max_concurrency: int = 8,
+):
+    """
+    Stores several pieces of data on the Bittensor network concurrently.
+
+    The metagraph and API axons are resolved once and shared by every upload, with at most
+    `max_concurrency` uploads in flight at a time.
+
+    Args:
+        datas (List[bytes]): The pieces of data to store.
+        max_concurrency (int, optional): The maximum number of concurrent uploads. Defaults to 8.
+        See `store` for the remaining arguments.
+
+    Returns:
+        list: A (cid, hotkeys) tuple for each piece of data, in the same order as `datas`.
+    """
     store_handler = StoreUserAPI(wallet)
 
-    subtensor = subtensor or bt.subtensor(chain_endpoint)
-    metagraph = subtensor.metagraph(netuid=netuid)
+    subtensor = subtensor or get_subtensor(chain_endpoint)
+    metagraph = get_metagraph(subtensor, netuid=netuid)
 
     uids = None
     if uid is not None:
         uids = [uid]
 
-    all_axons = await get_query_api_axons(wallet=wallet, metagraph=metagraph, uids=uids)
-    axons = random.choices(all_axons, k=3)
-
-    cid, hotkeys = await store_handler(
-        axons=axons,
-        data=data,
-        encrypt=encrypt,
-        ttl=ttl,
-        encoding=encoding,
-        uid=uid,
-        timeout=timeout,
+    all_axons = await get_query_api_axons(
+        wallet=wallet, metagraph=metagraph, uids=uids, dendrite=store_handler.dendrite
     )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def store_one(data):
+        async with semaphore:
+            axons = random.choices(all_axons, k=3)
+            return await store_handler(
+                axons=axons,
+                data=data,
+                encrypt=encrypt,
+                ttl=ttl,
+                encoding=encoding,
+                uid=uid,
+                timeout=timeout,
+            )
 
-    return cid, hotkeys
+    return await asyncio.gather(*(store_one(data) for data in datas))
@@ -1,6 +1,61 @@
+import time
 import torch
-import random
+import threading
 import bittensor as bt
+from typing import Dict, List, Tuple
+
+# Subtensor connections shared across API calls, keyed by chain endpoint
+_subtensors: Dict[str, "bt.subtensor"] = {}
+_subtensors_lock = threading.Lock()
+
+# Metagraphs shared across API calls, keyed by (chain endpoint, netuid)
+_metagraphs: Dict[Tuple[str, int], Tuple["bt.metagraph", float]] = {}
+_metagraphs_lock = threading.Lock()
+
+# Responsive API node uids found by pinging, keyed by (network, netuid, n)
+_api_node_uids: Dict[Tuple[str, int, float], Tuple[List[int], float]] = {}
+
+
+def get_subtensor(chain_endpoint: str = "finney") -> "bt.subtensor":
+    """
+    Returns a subtensor connected to the given chain endpoint, opening the connection
+    on first use and reusing it for subsequent calls.
+
+    Args:
+        chain_endpoint (str, optional): The chain endpoint to connect to. Defaults to "finney".
+
+    Returns:
+        bittensor.subtensor: The shared subtensor instance for the endpoint.
+    """
+    with _subtensors_lock:
+        if chain_endpoint not in _subtensors:
+            _subtensors[chain_endpoint] = bt.subtensor(chain_endpoint)
+        return _subtensors[chain_endpoint]
+
+
+def get_metagraph(
+    subtensor: "bt.subtensor", netuid: int = 21, ttl: int = 60
+) -> "bt.metagraph":
+    """
+    Returns the metagraph for a subnet, syncing it from the chain at most once every `ttl`
+    seconds and reusing it for the API calls in between.
+
+    Args:
+        subtensor (bittensor.subtensor): The subtensor instance to sync the metagraph with.
+        netuid (int, optional): The netuid of the subnet. Defaults to 21.
+        ttl (int, optional): The number of seconds a synced metagraph is reused for. Defaults to 60.
+
+    Returns:
+        bittensor.metagraph: The shared metagraph for the subnet.
+    """
+    key = (subtensor.chain_endpoint, netuid)
+    with _metagraphs_lock:
+        cached = _metagraphs.get(key)
+        if cached is not None and time.monotonic() - cached[1] < ttl:
+            return cached[0]
+        metagraph = subtensor.metagraph(netuid=netuid)
+        _metagraphs[key] = metagraph, time.monotonic()
+        return metagraph
 
 
 async def ping_uids(dendrite, metagraph, uids, timeout=3):
@@ -74,7 +129,9 @@ async def get_query_api_nodes(dendrite, metagraph, n=0.1, timeout=3):
     return query_uids
 
 
-async def get_query_api_axons(wallet, metagraph=None, n=0.1, timeout=3, uids=None):
+async def get_query_api_axons(
+    wallet, metagraph=None, n=0.1, timeout=3, uids=None, dendrite=None, ttl=30
+):
     """
     Retrieves the axons of query API nodes based on their availability and stake.
 
@@ -84,17 +141,29 @@ async def get_query_api_axons(wallet, metagraph=None, n=0.1, timeout=3, uids=Non
         n (float, optional): The fraction of top nodes to consider based on stake. Defaults to 0.1.
         timeout (int, optional): The timeout in seconds for pinging nodes. Defaults to 3.
         uids (Union[List[int], int], optional): The specific UID(s) of the API node(s) to query. Defaults to None.
+        dendrite (bittensor.dendrite, optional): The dendrite to ping nodes with, so that its connections
+            can be reused for the queries that follow. Defaults to a new dendrite for the wallet.
+        ttl (int, optional): The number of seconds the uids of responsive API nodes are reused for
+            before pinging again. Defaults to 30.
 
     Returns:
         list: A list of axon objects for the available API nodes.
     """
-    dendrite = bt.dendrite(wallet=wallet)
-
     if metagraph is None:
         metagraph = bt.metagraph(netuid=21)
 
     if uids is not None:
         query_uids = [uids] if isinstance(uids, int) else uids
     else:
-        query_uids = await get_query_api_nodes(dendrite, metagraph, n=n, timeout=timeout)
+        key = (metagraph.network, metagraph.netuid, n)
+        cached = _api_node_uids.get(key)
+        if cached is not None and time.monotonic() - cached[1] < ttl:
+            query_uids = cached[0]
+        else:
+            dendrite = dendrite or bt.dendrite(wallet=wallet)
+            query_uids = await get_query_api_nodes(
+                dendrite, metagraph, n=n, timeout=timeout
+            )
+            if query_uids:
+                _api_node_uids[key] = query_uids, time.monotonic()
     return [metagraph.axons[uid] for uid in query_uids]
@@ -18,12 +18,9 @@
 
 import os
 import json
-import torch
-import base64
 import argparse
 
 import storage
-from storage.validator.encryption import decrypt_data_with_private_key
 from storage.api.retrieve_api import retrieve
 
 import bittensor
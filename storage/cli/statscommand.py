@@ -19,15 +19,30 @@
 import argparse
 from redis import asyncio as aioredis
 import asyncio
+import numpy as np
 import bittensor as bt
 from rich.table import Table
 from rich.console import Console
 from storage.validator.database import get_miner_statistics, total_hotkey_storage
 
+COUNTER_FIELDS = (
+    "store_attempts",
+    "store_successes",
+    "challenge_attempts",
+    "challenge_successes",
+    "retrieve_attempts",
+    "retrieve_successes",
+)
+
 
 async def show_all_miner_statistics(r: aioredis.Redis):
     data = await get_miner_statistics(r)
 
+    # Fetch the current storage of every hotkey concurrently
+    storages = await asyncio.gather(
+        *[total_hotkey_storage(hotkey, r) for hotkey in data]
+    )
+
     console = Console()
 
     # Create a table
@@ -43,23 +58,24 @@ async def show_all_miner_statistics(r: aioredis.Redis):
     table.add_column("Tier")
     table.add_column("Current Storage / Limit (GB)")
 
-    for hotkey, stats in data.items():
-        # Compute the success rate for each task type
-        challenge_success_rate = (
-            int(stats["challenge_successes"]) / int(stats["challenge_attempts"])
-            if int(stats["challenge_attempts"]) > 0
-            else 0
-        )
-        retrieval_success_rate = (
-            int(stats["retrieve_successes"]) / int(stats["retrieve_attempts"])
-            if int(stats["retrieve_attempts"]) > 0
-            else 0
-        )
-        store_success_rate = (
-            int(stats["store_successes"]) / int(stats["store_attempts"])
-            if int(stats["store_attempts"]) > 0
-            else 0
-        )
+    # Cast the counters once into an (hotkeys, 6) array of
+    # (attempts, successes) column pairs for store, challenge and retrieve
+    counters = np.fromiter(
+        (int(stats[field]) for stats in data.values() for field in COUNTER_FIELDS),
+        dtype=np.int64,
+    ).reshape(-1, len(COUNTER_FIELDS))
+    attempts, successes = counters[:, 0::2], counters[:, 1::2]
+
+    # Compute the success rate for each task type in one pass, 0 where no attempts
+    success_rates = np.divide(
+        successes,
+        attempts,
+        out=np.zeros(attempts.shape, dtype=np.float64),
+        where=attempts > 0,
+    ).tolist()
+
+    for (hotkey, stats), storage, rates in zip(data.items(), storages, success_rates):
+        store_success_rate, challenge_success_rate, retrieval_success_rate = rates
 
         # Add rows to the table
         table.add_row(
@@ -72,7 +88,7 @@ async def show_all_miner_statistics(r: aioredis.Redis):
             str(challenge_success_rate * 100),
             str(retrieval_success_rate * 100),
             stats["tier"],
-            str(await total_hotkey_storage(hotkey, r) // (1024**3))
+            str(storage // (1024**3))
             + " / "
             + str(int(stats["storage_limit"]) // (1024**3)),
         )
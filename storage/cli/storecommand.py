@@ -18,21 +18,15 @@
 
 import os
 import json
-import base64
-import asyncio
 import argparse
 
 import storage
-from storage.validator.encryption import encrypt_data
-from storage.validator.cid import generate_cid_string
-from storage.shared.ecc import hash_data
 from storage.api.store_api import store
 
 import bittensor
 
 from typing import List
 from rich.prompt import Prompt
-from storage.validator.utils import get_all_validators
 
 from .default_values import defaults
 
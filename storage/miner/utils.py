@@ -18,8 +18,11 @@
 
 import os
 import json
+import mmap
 import time
+import hashlib
 import shutil
+import tempfile
 import storage
 import wandb
 import copy
@@ -95,8 +98,17 @@ def save_data_to_filesystem(data, directory, hotkey, filename):
     directory = os.path.join(os.path.expanduser(directory), hotkey)
     os.makedirs(directory, exist_ok=True)
     file_path = os.path.join(directory, filename)
-    with open(file_path, "wb") as file:
-        file.write(data)
+    # Write to a temporary file and rename it into place, so a file that is still
+    # memory-mapped by a challenge or retrieve is never truncated underneath it
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{filename}.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     return file_path
 
 
@@ -117,6 +129,32 @@ def load_from_filesystem(filepath):
     return data
 
 
+def map_from_filesystem(filepath):
+    """
+    Memory-maps a file in the filesystem for reading.
+
+    Parameters:
+    - filepath (str): The path to the file to be mapped.
+
+    Returns:
+    - data: A read-only mmap of the file contents (empty bytes for an empty file).
+
+    Unlike load_from_filesystem, the file is not copied into a Python bytes object up front;
+    pages are read on demand and shared with the kernel page cache. Challenges and retrievals
+    hash the whole file straight away and then read it front to back, so the kernel is hinted
+    to read the mapping sequentially and to start paging all of it in immediately.
+    """
+    with open(os.path.expanduser(filepath), "rb") as file:
+        # Zero-length files cannot be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+        if hasattr(mmap, advice):
+            data.madvise(getattr(mmap, advice))
+    return data
+
+
 def compute_subsequent_commitment(data, previous_seed, new_seed, verbose=False):
     """
     Computes a new commitment based on provided data and a change from an old seed to a new seed.
@@ -140,7 +178,11 @@ def compute_subsequent_commitment(data, previous_seed, new_seed, verbose=False):
         bt.logging.debug("type of data     :", type(data))
         bt.logging.debug("type of prev_seed:", type(previous_seed))
         bt.logging.debug("type of new_seed :", type(new_seed))
-    proof = hash_data(data + previous_seed)
+    # Feed the data and seed to the hash separately rather than concatenating them,
+    # which would copy the full (possibly hundreds of MB) data on every call
+    hasher = hashlib.sha3_256(data)
+    hasher.update(previous_seed)
+    proof = int(hasher.hexdigest(), 16)
     return hash_data(str(proof).encode("utf-8") + new_seed), proof
 
 
@@ -271,7 +313,10 @@ def update_storage_stats(self):
     bt.logging.info(f"Free memory: {self.free_memory} bytes")
     self.current_storage_usage = get_directory_size(self.config.database.directory)
     bt.logging.info(f"Miner storage usage: {self.current_storage_usage} bytes")
-    self.percent_disk_usage = self.current_storage_usage / (self.free_memory + self.current_storage_usage)
+    total_disk_space = self.free_memory + self.current_storage_usage
+    self.percent_disk_usage = (
+        self.current_storage_usage / total_disk_space if total_disk_space else 0.0
+    )
     bt.logging.info(f"Miner % disk usage : {100 * self.percent_disk_usage:.3f}%")
 
 
@@ -30,7 +30,7 @@ def hash_data(data):
     strings and then encoding to bytes before hashing.
 
     Parameters:
-    - data (bytes | bytearray | object): Data to be hashed.
+    - data (bytes | bytearray | memoryview | object): Data to be hashed.
 
     Returns:
     - int: Integer representation of the SHA3-256 hash of the input data.
@@ -38,7 +38,7 @@ def hash_data(data):
     Raises:
     - TypeError: If the hashing operation encounters an incompatible data type.
     """
-    if not isinstance(data, (bytes, bytearray)):
+    if not isinstance(data, (bytes, bytearray, memoryview)):
         data_str = str(data)
         data = data_str.encode()
     h = hashlib.sha3_256(data).hexdigest()
@@ -52,7 +52,11 @@ def b64_encode(data: Union[bytes, str, List[str], List[bytes], dict]) -> str:
         data = data.hex()
     if isinstance(data, list) and len(data) and isinstance(data[0], bytes):
         data = [d.hex() for d in data]
-    if isinstance(data, dict) and isinstance(data[list(data.keys())[0]], bytes):
+    if (
+        isinstance(data, dict)
+        and len(data)
+        and isinstance(next(iter(data.values())), bytes)
+    ):
         data = {k: v.hex() for k, v in data.items()}
     return base64.b64encode(json.dumps(data).encode()).decode("utf-8")
 
@@ -20,7 +20,27 @@ import math
 import asyncio
 from redis import asyncio as aioredis
 import bittensor as bt
-from storage.constants import *
+from storage.constants import (
+    STORAGE_LIMIT_SUPER_SAIYAN,
+    STORAGE_LIMIT_DIAMOND,
+    STORAGE_LIMIT_GOLD,
+    STORAGE_LIMIT_SILVER,
+    STORAGE_LIMIT_BRONZE,
+    SUPER_SAIYAN_TIER_REWARD_FACTOR,
+    DIAMOND_TIER_REWARD_FACTOR,
+    GOLD_TIER_REWARD_FACTOR,
+    SILVER_TIER_REWARD_FACTOR,
+    BRONZE_TIER_REWARD_FACTOR,
+    SUPER_SAIYAN_TIER_TOTAL_SUCCESSES,
+    DIAMOND_TIER_TOTAL_SUCCESSES,
+    GOLD_TIER_TOTAL_SUCCESSES,
+    SILVER_TIER_TOTAL_SUCCESSES,
+    SUPER_SAIYAN_WILSON_SCORE,
+    DIAMOND_WILSON_SCORE,
+    GOLD_WILSON_SCORE,
+    SILVER_WILSON_SCORE,
+    TIER_BOOSTS,
+)
 
 
 def wilson_score_interval(successes, total):
@@ -175,21 +195,25 @@ async def update_statistics(
         store_successes = await database.hget(stats_key, "store_successes")
         if store_successes is None:
             store_successes = 0
-            database.hset(stats_key, "store_successes", 0) # ensure field exists
+            await database.hset(stats_key, "store_successes", 0)  # ensure field exists
         else:
             store_successes = int(store_successes)
 
         challenge_successes = await database.hget(stats_key, "challenge_successes")
         if challenge_successes is None:
             challenge_successes = 0
-            database.hset(stats_key, "challenge_successes", 0) # ensure field exists
+            await database.hset(
+                stats_key, "challenge_successes", 0
+            )  # ensure field exists
         else:
             challenge_successes = int(challenge_successes)
 
         retrieval_successes = await database.hget(stats_key, "retrieve_successes")
         if retrieval_successes is None:
             retrieval_successes = 0
-            database.hset(stats_key, "retrieve_successes", 0) # ensure field exists
+            await database.hset(
+                stats_key, "retrieve_successes", 0
+            )  # ensure field exists
         else:
             retrieval_successes = int(retrieval_successes)
 
@@ -16,7 +16,6 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import sys
 import time
 import torch
 import typing
@@ -95,9 +94,8 @@ async def handle_challenge(self, uid: int) -> typing.Tuple[bool, protocol.Challe
         )
         chunk_size = 0
 
-    num_chunks = (
-        data["size"] // chunk_size if data["size"] > chunk_size else data["size"]
-    )
+    # Data no larger than one chunk still has exactly one chunk to challenge
+    num_chunks = max(1, data["size"] // chunk_size)
     if self.config.neuron.verbose:
         bt.logging.trace(f"challenge data size : {data['size']}")
         bt.logging.trace(f"challenge chunk size: {chunk_size}")
@@ -181,7 +179,7 @@ async def challenge_data(self):
         for response in responses
     ]
     bt.logging.debug(f"Dendrite Times: {times}")
-    sorted_times = sorted(list(zip(uids, times)), key=lambda x: x[1])
+    sorted_times = sorted(zip(uids, times), key=lambda x: x[1])
 
     bt.logging.debug(f"Sorted Times: {sorted_times}")
     in_top_2_dict = {
@@ -192,14 +190,18 @@ async def challenge_data(self):
 
     remove_reward_idxs = []
     data_sizes = []
+    log_responses = self.config.neuron.verbose and self.config.neuron.log_responses
     for idx, (uid, (verified, response)) in enumerate(zip(uids, responses)):
-        response_dict = response[0].axon.dict() if response[0] is not None else None
-        bt.logging.trace(
-            f"Challenge idx {idx} uid {uid} verified {verified} response {str(response_dict)}"
-        )
+        if log_responses:
+            # Only serialize the axon model when responses are actually logged
+            response_dict = response[0].axon.dict() if response[0] is not None else None
+            bt.logging.trace(
+                f"Challenge idx {idx} uid {uid} verified {verified} response {str(response_dict)}"
+            )
 
         # Calculate the size of the response and add it to the total batch size
-        data_size = sys.getsizeof(response[0].data_chunk)
+        # Dummy and timed-out responses carry no data chunk
+        data_size = len(response[0].data_chunk or b"")
         data_sizes.append(data_size)
 
         hotkey = self.metagraph.hotkeys[uid]
@@ -21,6 +21,7 @@ import time
 from redis import asyncio as aioredis
 import asyncio
 import bittensor as bt
+from collections import defaultdict
 from typing import Dict, List, Any, Union, Optional
 
 
@@ -108,14 +109,26 @@ async def is_ttl_expired_for_hash_and_hotkey(
         True if the TTL has expired, False otherwise.
     """
     key = f"hotkey:{ss58_address}"
-    elapsed = await get_time_since_generation_for_hash_and_hotkey(
-        data_hash, ss58_address, database
-    )
-    ttl = await get_ttl_for_hash_and_hotkey(data_hash, ss58_address, database)
-    if elapsed > ttl:
-        return True
-    else:
+    # Elapsed time and TTL live in the same field, fetch it once
+    ttl_metadata = await database.hget(key, f"ttl:{data_hash}")
+    if not ttl_metadata:
         return False
+    return is_ttl_metadata_expired(ttl_metadata)
+
+
+def is_ttl_metadata_expired(ttl_metadata: Union[bytes, str]) -> bool:
+    """
+    Checks if already fetched TTL metadata has expired.
+
+    Parameters:
+        ttl_metadata (bytes | str): The serialized TTL metadata stored under `ttl:<data_hash>`.
+
+    Returns:
+        True if the TTL has expired, False otherwise.
+    """
+    ttl_metadata = json.loads(ttl_metadata)
+    elapsed = time.time() - float(ttl_metadata["generated"])
+    return elapsed > int(ttl_metadata["ttl"])
 
 
 async def purge_expired_ttl_keys(database: aioredis.Redis):
@@ -130,12 +143,13 @@ async def purge_expired_ttl_keys(database: aioredis.Redis):
         if not hotkey.startswith(b"hotkey:"):
             continue
         data_hashes = await database.hgetall(hotkey)
-        for data_hash in data_hashes:
+        for data_hash, metadata in data_hashes.items():
             data_hash = data_hash.decode("utf-8")
             if data_hash.startswith("ttl:"):
                 hk = hotkey.decode("utf-8")[7:]
                 hs = data_hash[4:]
-                if await is_ttl_expired_for_hash_and_hotkey(hs, hk, database):
+                # Reuse the TTL metadata from HGETALL instead of re-fetching it
+                if is_ttl_metadata_expired(metadata):
                     await remove_metadata_from_hotkey(hk, hs, database)
 
 
@@ -237,6 +251,31 @@ async def get_hashes_for_hotkey(
     ]
 
 
+async def get_hashes_for_hotkeys(
+    ss58_addresses: List[str], database: aioredis.Redis
+) -> Dict[str, List[str]]:
+    """
+    Retrieves all data hashes for a list of hotkeys in a single round-trip.
+
+    Parameters:
+        ss58_addresses (list): The hotkeys to fetch data hashes for.
+        database (aioredis.Redis): The Redis client instance.
+
+    Returns:
+        A dictionary where keys are hotkeys and values are lists of data hashes.
+    """
+    # Queue one HKEYS per hotkey and flush them together
+    pipe = database.pipeline(transaction=False)
+    for ss58_address in ss58_addresses:
+        pipe.hkeys(f"hotkey:{ss58_address}")
+    results = await pipe.execute()
+
+    return {
+        ss58_address: [data_hash.decode("utf-8") for data_hash in data_hashes]
+        for ss58_address, data_hashes in zip(ss58_addresses, results)
+    }
+
+
 async def remove_hashes_for_hotkey(
     ss58_address: str, hashes: list, database: aioredis.Redis
 ) -> List[str]:
@@ -253,8 +292,12 @@ async def remove_hashes_for_hotkey(
     bt.logging.trace(
         f"remove_hashes_for_hotkey() removing {len(hashes)} hashes from hotkey {ss58_address}"
     )
-    for _hash in hashes:
-        await remove_metadata_from_hotkey(ss58_address, _hash, database)
+    if not hashes:
+        return
+
+    # Delete the data hashes and their TTLs in a single HDEL
+    fields = list(hashes) + [f"ttl:{_hash}" for _hash in hashes]
+    await database.hdel(f"hotkey:{ss58_address}", *fields)
 
 
 async def update_metadata_for_data_hash(
@@ -318,22 +361,23 @@ async def get_all_chunk_hashes(database: aioredis.Redis) -> Dict[str, List[str]]
         A dictionary where keys are chunk hashes and values are lists of hotkeys associated with each chunk hash.
     """
     # Initialize an empty dictionary to store the inverse map
-    chunk_hash_hotkeys = {}
+    chunk_hash_hotkeys = defaultdict(list)
 
     # Retrieve all hotkeys (assuming keys are named with a 'hotkey:' prefix)
-    async for hotkey in database.scan_iter("*"):
-        if not hotkey.startswith(b"hotkey:"):
-            continue
-        # Fetch all fields (data hashes) for the current hotkey
-        data_hashes = await database.hkeys(hotkey)
-        # Iterate over each data hash and append the hotkey to the corresponding list
+    hotkeys = [
+        key.decode("utf-8").split(":")[1]
+        async for key in database.scan_iter("hotkey:*")
+    ]
+
+    # Fetch all fields (data hashes) for every hotkey in one pipeline
+    hotkey_hashes = await get_hashes_for_hotkeys(hotkeys, database)
+
+    # Iterate over each data hash and append the hotkey to the corresponding list
+    for hotkey, data_hashes in hotkey_hashes.items():
         for data_hash in data_hashes:
-            data_hash = data_hash.decode("utf-8")
-            if data_hash not in chunk_hash_hotkeys:
-                chunk_hash_hotkeys[data_hash] = []
-            chunk_hash_hotkeys[data_hash].append(hotkey.decode("utf-8").split(":")[1])
+            chunk_hash_hotkeys[data_hash].append(hotkey)
 
-    return chunk_hash_hotkeys
+    return dict(chunk_hash_hotkeys)
 
 
 async def get_all_full_hashes(database: aioredis.Redis) -> List[str]:
@@ -405,18 +449,30 @@ async def total_hotkey_storage(
     Returns:
         The total storage used by the hotkey in bytes.
     """
+    # Fetch all metadata for the hotkey in a single round trip
+    hotkey_metadata = await database.hgetall(f"hotkey:{hotkey}")
+    total_storage = sum_hotkey_metadata_sizes(hotkey_metadata)
+    if verbose:
+        bt.logging.trace(f"hotkey {hotkey[:16]} | total storage {total_storage}")
+    return total_storage
+
+
+def sum_hotkey_metadata_sizes(hotkey_metadata: Dict[bytes, bytes]) -> int:
+    """
+    Sums the data sizes stored in a hotkey's raw metadata hash, skipping TTL fields.
+
+    Parameters:
+        hotkey_metadata (Dict[bytes, bytes]): The HGETALL result for a hotkey key.
+
+    Returns:
+        The total storage described by the metadata in bytes.
+    """
     total_storage = 0
-    keys = await database.hkeys(f"hotkey:{hotkey}")
-    for data_hash in keys:
-        if data_hash.startswith(b"ttl:"):
+    for data_hash, metadata_json in hotkey_metadata.items():
+        if data_hash.startswith(b"ttl:") or not metadata_json:
             continue
-        # Get the metadata for the current data hash
-        metadata = await get_metadata_for_hotkey_and_hash(
-            hotkey, data_hash, database, verbose
-        )
-        if metadata:
-            # Add the size of the data to the total storage
-            total_storage += metadata["size"]
+        # Add the size of the data to the total storage
+        total_storage += json.loads(metadata_json)["size"]
     return total_storage
 
 
@@ -470,26 +526,38 @@ async def cache_hotkeys_capacity(
     Parameters:
         hotkeys (list): List of hotkey strings to check.
         database (aioredis.Redis): The Redis client instance.
+        verbose (bool): Whether to trace missing or unparsable storage limits.
 
     Returns:
         dict: A dictionary with hotkeys as keys and a tuple of (total_storage, limit) as values.
     """
     hotkeys_capacity = {}
 
+    # Fetch the metadata and the byte limit for every hotkey in one pipeline
+    pipe = database.pipeline(transaction=False)
     for hotkey in hotkeys:
+        pipe.hgetall(f"hotkey:{hotkey}")
+        pipe.hget(f"stats:{hotkey}", "storage_limit")
+    results = await pipe.execute()
+
+    for hotkey, hotkey_metadata, byte_limit in zip(
+        hotkeys, results[0::2], results[1::2]
+    ):
         # Get the total storage used by the hotkey
-        total_storage = await total_hotkey_storage(hotkey, database, verbose)
-        # Get the byte limit for the hotkey
-        byte_limit = await database.hget(f"stats:{hotkey}", "storage_limit")
+        total_storage = sum_hotkey_metadata_sizes(hotkey_metadata)
 
         if byte_limit is None:
-            bt.logging.warning(f"Could not find storage limit for {hotkey}.")
+            if verbose:
+                bt.logging.trace(f"Could not find storage limit for {hotkey}.")
             limit = None
         else:
             try:
                 limit = int(byte_limit)
             except Exception as e:
-                bt.logging.warning(f"Could not parse storage limit for {hotkey} | {e}.")
+                if verbose:
+                    bt.logging.trace(
+                        f"Could not parse storage limit for {hotkey} | {e}."
+                    )
                 limit = None
 
         hotkeys_capacity[hotkey] = (total_storage, limit)
@@ -528,25 +596,35 @@ async def check_hotkeys_capacity(hotkeys_capacity, hotkey: str, verbose: bool =
         return False
 
 
-async def total_validator_storage(database: aioredis.Redis) -> int:
+# Last computed total validator storage per database, as (timestamp, total_storage)
+_total_storage_cache: Dict[int, tuple] = {}
+
+
+async def total_validator_storage(database: aioredis.Redis, ttl: int = 0) -> int:
     """
     Calculates the total storage used by all hotkeys in the database.
 
     Parameters:
         database (aioredis.Redis): The Redis client instance.
+        ttl (int): Seconds a previously computed total may be reused for. Defaults to 0 (always recompute).
 
     Returns:
         The total storage used by all hotkeys in the database in bytes.
     """
-    total_storage = 0
+    # This is a full scan over every hotkey, serve a recent result if allowed
+    cached = _total_storage_cache.get(id(database))
+    if cached is not None and time.time() - cached[0] < ttl:
+        return cached[1]
+
     # Iterate over all hotkeys
-    async for hotkey in database.scan_iter("*"):
-        if not hotkey.startswith(b"hotkey:"):
-            continue
-        # Grab storage for that hotkey
-        total_storage += await total_hotkey_storage(
-            hotkey.decode().split(":")[1], database
-        )
+    hotkeys = [
+        hotkey.decode().split(":")[1] async for hotkey in database.scan_iter("hotkey:*")
+    ]
+    # Grab storage for all hotkeys concurrently
+    tasks = [total_hotkey_storage(hotkey, database) for hotkey in hotkeys]
+    total_storage = sum(await asyncio.gather(*tasks))
+
+    _total_storage_cache[id(database)] = (time.time(), total_storage)
     return total_storage
 
 
@@ -559,9 +637,15 @@ async def get_miner_statistics(database: aioredis.Redis) -> Dict[str, Dict[str,
         A dictionary where keys are hotkeys and values are dictionaries containing the statistics for each hotkey.
     """
     stats = {}
-    async for key in database.scan_iter(b"stats:*"):
-        # Await the hgetall call and then process its result
-        key_stats = await database.hgetall(key)
+    keys = [key async for key in database.scan_iter(b"stats:*")]
+
+    # Fetch the statistics for every miner in one pipeline
+    pipe = database.pipeline(transaction=False)
+    for key in keys:
+        pipe.hgetall(key)
+    results = await pipe.execute()
+
+    for key, key_stats in zip(keys, results):
         # Process the key_stats as required
         processed_stats = {
             k.decode("utf-8"): v.decode("utf-8") for k, v in key_stats.items()
@@ -623,8 +707,10 @@ async def store_file_chunk_mapping_ordered(
     - encryption_payload (Optional[Union[bytes, dict]]): The encryption payload to store with the file.
     """
     key = f"file:{full_hash}"
-    for chunk_index, chunk_hash in zip(chunk_indices, chunk_hashes):
-        await database.zadd(key, {chunk_hash: chunk_index})
+    # Write every chunk in a single ZADD rather than one round-trip per chunk
+    mapping = dict(zip(chunk_hashes, chunk_indices))
+    if mapping:
+        await database.zadd(key, mapping)
 
     # Store the encryption payload if provided
     if encryption_payload:
@@ -759,13 +845,13 @@ async def add_hotkey_to_chunk(chunk_hash: str, hotkey: str, database: aioredis.R
             await database.hset(
                 chunk_metadata_key, "hotkeys", ",".join(updated_hotkeys)
             )
-            print(f"UID {hotkey} added to chunk {chunk_hash}.")
+            bt.logging.trace(f"UID {hotkey} added to chunk {chunk_hash}.")
         else:
-            print(f"UID {hotkey} already exists for chunk {chunk_hash}.")
+            bt.logging.trace(f"UID {hotkey} already exists for chunk {chunk_hash}.")
     else:
         # If no UIDs are associated with this chunk, create a new entry
         await database.hmset(chunk_metadata_key, {"hotkeys": hotkey})
-        print(f"UID {hotkey} set for new chunk {chunk_hash}.")
+        bt.logging.trace(f"UID {hotkey} set for new chunk {chunk_hash}.")
 
 
 async def remove_hotkey_from_chunk(
@@ -883,15 +969,17 @@ async def retrieve_mutually_exclusive_hotkeys_full_hash(
         return None
 
     ordered_chunks = sorted(chunks_info.items(), key=lambda x: x[0])
-    mutually_exclusive_hotkeys = {}
+    # Insertion-ordered dicts dedupe hotkeys per chunk without list membership scans
+    mutually_exclusive_hotkeys = defaultdict(dict)
     for _, chunk_info in ordered_chunks:
-        if chunk_info["chunk_hash"] not in mutually_exclusive_hotkeys:
-            mutually_exclusive_hotkeys[chunk_info["chunk_hash"]] = []
-        for hotkey in chunk_info["hotkeys"]:
-            if hotkey not in mutually_exclusive_hotkeys[chunk_info["chunk_hash"]]:
-                mutually_exclusive_hotkeys[chunk_info["chunk_hash"]].append(hotkey)
+        mutually_exclusive_hotkeys[chunk_info["chunk_hash"]].update(
+            dict.fromkeys(chunk_info["hotkeys"])
+        )
 
-    return mutually_exclusive_hotkeys
+    return {
+        chunk_hash: list(hotkeys)
+        for chunk_hash, hotkeys in mutually_exclusive_hotkeys.items()
+    }
 
 
 async def check_hash_type(data_hash: str, database: aioredis.Redis) -> str:
@@ -916,7 +1004,7 @@ async def check_hash_type(data_hash: str, database: aioredis.Redis) -> str:
     return "challenge"
 
 
-async def is_file_chunk(chunk_hash: str, database: aioredis.Redis) -> str:
+async def is_file_chunk(chunk_hash: str, database: aioredis.Redis) -> bool:
     """
     Determines if the given chunk_hash is part of a full file.
 
@@ -927,10 +1015,7 @@ async def is_file_chunk(chunk_hash: str, database: aioredis.Redis) -> str:
     Returns:
     - bool: True if the hash belongs to a full file, false otherwise (challenge data)
     """
-    async for key in database.scan_iter(match="chunk:*"):
-        if chunk_hash in key.decode():
-            return True
-    return False
+    return bool(await database.exists(f"chunk:{chunk_hash}"))
 
 
 async def get_all_hashes_in_database(database: aioredis.Redis) -> List[str]:
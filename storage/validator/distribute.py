@@ -55,13 +55,13 @@ async def distribute_data(self, k: int):
     # This is to get the hotkeys that already contain chunks for file
     # Such that we can exclude them from the subsequent call to store_broadband
     exclude_uids = set()
+    hotkey_to_uid = {hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)}
     for chunk_metadata in ordered_metadata:
         bt.logging.debug(f"chunk metadata: {chunk_metadata}")
         uids = [
-            self.metagraph.hotkeys.index(hotkey)
+            hotkey_to_uid[hotkey]
             for hotkey in chunk_metadata["hotkeys"]
-            if hotkey
-            in self.metagraph.hotkeys  # TODO: make a more efficient check for this
+            if hotkey in hotkey_to_uid
         ]
         # Collect all uids for later exclusion
         exclude_uids.update(uids)
@@ -104,7 +104,12 @@ async def forward(self):
         bt.logging.info("initiating TTL purge for expired keys")
         await purge_expired_ttl_keys(self.database)
 
-    if self.subtensor.get_current_block() % 1080 == 0 and self.step > 0:
+    # Compute stats once per 1080 block window. Comparing windows rather than testing
+    # for block % 1080 == 0 keeps runs aligned without skipping windows whenever a
+    # step does not land exactly on the boundary block.
+    current_block = self.subtensor.get_current_block()
+    if current_block // 1080 > self.last_compute_stats_block // 1080:
+        self.last_compute_stats_block = current_block
         bt.logging.info("initiating compute stats")
         await compute_all_tiers(self.database)
 
@@ -130,8 +135,8 @@ async def forward(self):
             # Also upload the total network storage periodically
             self.wandb.save(self.config.neuron.total_storage_path)
 
-    # Update the total network storage
-    total_storage = await total_validator_storage(self.database)
+    # Update the total network storage (reused across steps for up to a minute)
+    total_storage = await total_validator_storage(self.database, ttl=60)
     bt.logging.info(f"Total validator storage (GB): {int(total_storage) // (1024**3)}")
 
     # Get the current local time
@@ -16,7 +16,6 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import sys
 import time
 import torch
 import base64
@@ -167,7 +166,7 @@ async def retrieve_data(
         for response, _, _ in response_tuples
     ]
     bt.logging.debug(f"Dendrite Times: {times}")
-    sorted_times = sorted(list(zip(uids, times)), key=lambda x: x[1])
+    sorted_times = sorted(zip(uids, times), key=lambda x: x[1])
 
     bt.logging.debug(f"Sorted Times: {sorted_times}")
     in_top_2_dict = {
@@ -187,8 +186,8 @@ async def retrieve_data(
             bt.logging.debug(f"No response: skipping retrieve for uid {uid}")
             continue  # We don't have any data for this hotkey, skip it.
 
-        # Collect data sizes from responses
-        data_sizes.append(sys.getsizeof(response.data))
+        # Collect data sizes from responses (timed-out responses carry no data)
+        data_sizes.append(len(response.data or ""))
 
         # Get the tier factor for this miner to determine the total reward
         tier_factor = await get_tier_factor(hotkey, self.database, in_top_2=in_top_2_dict.get(uid, False))
@@ -374,15 +373,18 @@ async def retrieve_broadband(self, full_hash: str):
     # TODO: change this to use retrieve_mutually_exclusive_hotkeys_full_hash
     # to avoid possibly double querying miners for greater retrieval efficiency
 
+    # Build the hotkey -> uid lookup once rather than scanning the metagraph per chunk
+    hotkey_to_uid = {hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)}
+
     async with semaphore:
         for chunk_metadata in ordered_metadata:
             bt.logging.debug(f"chunk metadata: {chunk_metadata}")
 
             # Ensure still registered before trying to retrieve
             uids = [
-                self.metagraph.hotkeys.index(hotkey)
+                hotkey_to_uid[hotkey]
                 for hotkey in chunk_metadata["hotkeys"]
-                if hotkey in self.metagraph.hotkeys
+                if hotkey in hotkey_to_uid
             ]
 
             # Don't waste time waiting on UIDs that are nonresponsive anyway
@@ -407,9 +409,9 @@ async def retrieve_broadband(self, full_hash: str):
                 verified = verify_retrieve_with_seed(response, seed)
                 if verified:
                     # Add to final chunks dict
-                    if i not in list(chunks.keys()):
+                    if i not in chunks:
                         bt.logging.debug(
-                            f"Adding chunk {i} to chunks, size: {sys.getsizeof(response.data)}"
+                            f"Adding chunk {i} to chunks, size: {len(response.data)}"
                         )
                         chunks[i] = base64.b64decode(response.data)
                         bt.logging.debug(f"chunk {i} | {chunks[i][:10]}")
@@ -162,8 +162,14 @@ def scale_rewards(
     log_data_sizes_np = np.log1p(data_sizes)
     bt.logging.trace(f"Logarithmically scaled data sizes: {log_data_sizes_np}")
 
-    # Normalize the response times by data size (unit time)
-    data_normalized_process_times = np.asarray(np.array(process_times) / log_data_sizes_np)
+    # Normalize the response times by data size (unit time), leaving empty payloads unscaled
+    process_times_np = np.array(process_times, dtype=np.float64)
+    data_normalized_process_times = np.divide(
+        process_times_np,
+        log_data_sizes_np,
+        out=process_times_np.copy(),
+        where=log_data_sizes_np > 0,
+    )
 
     # Normalize the response times
     normalized_times = sigmoid_normalize(data_normalized_process_times, max(data_normalized_process_times))
@@ -182,8 +188,13 @@ def scale_rewards(
         ]
     )
 
-    # Final normalization if needed
-    rescale_factor = torch.sum(rewards) / torch.sum(time_scaled_rewards)
+    # Final normalization if needed (all-zero scaled rewards stay zero instead of NaN)
+    total_time_scaled_rewards = torch.sum(time_scaled_rewards)
+    rescale_factor = (
+        torch.sum(rewards) / total_time_scaled_rewards
+        if total_time_scaled_rewards > 0
+        else 0.0
+    )
     bt.logging.trace(f"Rescale factor: {rescale_factor}")
     scaled_rewards = [reward * rescale_factor for reward in time_scaled_rewards]
 
@@ -284,7 +295,7 @@ async def create_reward_vector(
         for response in responses
     ]
     bt.logging.debug(f"Dendrite Times: {times}")
-    sorted_times = sorted(list(zip(uids, times)), key=lambda x: x[1])
+    sorted_times = sorted(zip(uids, times), key=lambda x: x[1])
 
     bt.logging.debug(f"Sorted Times: {sorted_times}")
     in_top_2_dict = {
@@ -16,7 +16,6 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import sys
 import copy
 import time
 import torch
@@ -49,7 +48,8 @@ from storage.validator.database import (
     store_chunk_metadata,
     store_file_chunk_mapping_ordered,
     get_ordered_metadata,
-    hotkey_at_capacity,
+    cache_hotkeys_capacity,
+    check_hotkeys_capacity,
 )
 from storage.validator.cid import generate_cid_string
 from storage.validator.bonding import update_statistics
@@ -149,7 +149,7 @@ async def store_encrypted_data(
             # Prepare storage for the data for particular miner
             response_storage = {
                 "prev_seed": synapse.seed,
-                "size": sys.getsizeof(encrypted_data),  # in bytes, not len(data)
+                "size": len(encrypted_data),  # in bytes
                 "encryption_payload": encryption_payload,
             }
             bt.logging.trace(f"Storing UID {uid} data {pformat(response_storage)}")
@@ -182,7 +182,7 @@ async def store_encrypted_data(
             ]
 
         bt.logging.trace(f"Applying store rewards for retry: {retries}")
-        data_size = sys.getsizeof(b64_encrypted_data)
+        data_size = len(b64_encrypted_data)
         apply_reward_scores(
             self,
             uids=uids,
@@ -235,7 +235,7 @@ async def store_random_data(self):
 
     # Make a random bytes file to test the miner if none provided
     data = make_random_file(maxsize=self.config.neuron.maxsize)
-    bt.logging.debug(f"Random store data size: {sys.getsizeof(data)}")
+    bt.logging.debug(f"Random store data size: {len(data)}")
 
     # Encrypt the data
     # TODO: create and use a throwaway wallet (never decrypable)
@@ -313,8 +313,8 @@ async def store_broadband(
         g, h = setup_CRS(curve=self.config.neuron.curve)
 
         bt.logging.debug(f"type(chunk): {type(chunk)}")
-        bt.logging.debug(f"chunk: {chunk[:100]}")
         chunk = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        bt.logging.debug(f"chunk: {bytes(chunk[:100])}")
         b64_encoded_chunk = await asyncio.to_thread(base64.b64encode, chunk)
         b64_encoded_chunk = b64_encoded_chunk.decode("utf-8")
         bt.logging.debug(f"b64_encoded_chunk: {b64_encoded_chunk[:100]}")
@@ -329,10 +329,13 @@ async def store_broadband(
             ttl=ttl or self.config.neuron.data_ttl,
         )
 
+        # Fetch the capacity of every hotkey in one round trip instead of two per uid
+        hotkeys = [self.metagraph.hotkeys[uid] for uid in uids]
+        hotkeys_capacity = await cache_hotkeys_capacity(hotkeys, self.database)
         uids = [
             uid
-            for uid in uids
-            if not await hotkey_at_capacity(self.metagraph.hotkeys[uid], self.database)
+            for uid, hotkey in zip(uids, hotkeys)
+            if not await check_hotkeys_capacity(hotkeys_capacity, hotkey)
         ]
 
         axons = [self.metagraph.axons[uid] for uid in uids]
@@ -361,7 +364,7 @@ async def store_broadband(
         )
         event.rewards.extend(rewards.tolist())
 
-        data_size = sys.getsizeof(b64_encoded_chunk)
+        data_size = len(b64_encoded_chunk)
         apply_reward_scores(
             self,
             uids=uids,
@@ -378,14 +381,14 @@ async def store_broadband(
             event.best_uid = event.uids[best_index]
             event.best_hotkey = self.metagraph.hotkeys[event.best_uid]
 
-        chunk_size = sys.getsizeof(chunk)  # chunk size in bytes
+        chunk_size = len(chunk)  # chunk size in bytes
         bt.logging.debug(f"chunk size: {chunk_size}")
 
         await store_chunk_metadata(
             full_hash,
             chunk_hash,
             [self.metagraph.hotkeys[uid] for uid in uids],
-            chunk_size,  # this should be len(chunk) but we need to fix the chunking
+            chunk_size,
             self.database,
         )
 
@@ -440,13 +443,19 @@ async def store_broadband(
 
     async def semaphore_query_miners(distributions):
         tasks = []
+        # Slice the chunks as views of the payload rather than copying each one out
+        data_view = memoryview(
+            encrypted_data.encode("utf-8")
+            if isinstance(encrypted_data, str)
+            else encrypted_data
+        )
         async with semaphore:
             for i, dist in enumerate(distributions):
                 bt.logging.trace(
                     f"Start index: {dist['start_idx']}, End index: {dist['end_idx']}"
                 )
-                chunk = encrypted_data[dist["start_idx"] : dist["end_idx"]]
-                bt.logging.trace(f"chunk: {chunk[:12]}")
+                chunk = data_view[dist["start_idx"] : dist["end_idx"]]
+                bt.logging.trace(f"chunk: {bytes(chunk[:12])}")
                 dist["chunk_hash"] = hash_data(chunk)
                 bt.logging.debug(
                     f"Chunk {i} | uid distribution: {dist['uids']} | size: {dist['chunk_size']}"
@@ -499,7 +508,7 @@ async def store_broadband(
     async def create_initial_distributions(encrypted_data, R, k):
         dist_gen = compute_chunk_distribution_mut_exclusive_numpy_reuse_uids(
             self,
-            data_size=sys.getsizeof(encrypted_data),
+            data_size=len(encrypted_data),
             R=R,
             k=k,
             exclude=exclude_uids,
@@ -535,7 +544,7 @@ async def store_broadband(
     exclude_uids = exclude_uids + list(failed_uids)
     bt.logging.debug(f"Updated exclude_uids: {exclude_uids}")
 
-    full_size = sys.getsizeof(encrypted_data)
+    full_size = len(encrypted_data)
     bt.logging.debug(f"full size: {full_size}")
 
     # Sometimes this can fail, try/catch and retry for starters...
@@ -18,14 +18,18 @@
 
 import os
 import math
+import asyncio
 import time
 import torch
+import warnings
 import functools
 import numpy as np
 import random as pyrandom
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from Crypto.Random import random
-from itertools import combinations, cycle
+from types import SimpleNamespace
 from typing import List, Union
 
 from storage.shared.ecc import hash_data
@@ -36,21 +40,44 @@ import bittensor as bt
 
 MIN_CHUNK_SIZE = 64 * 1024 * 1024  # 128 MB
 MAX_CHUNK_SIZE = 512 * 1024 * 1024  # 512 MB
+RANDOM_FILE_BLOCK_SIZE = 4 * 1024 * 1024  # 4 MB
 
 
 def chunk_data_generator(data, chunk_size):
     """
-    Generator that yields chunks of data.
+    Generator that yields zero-copy chunks of data.
 
     Args:
         data (bytes): The data to be chunked.
         chunk_size (int): The size of each chunk in bytes.
 
     Yields:
-        bytes: The next chunk of data.
+        memoryview: A view of the next chunk of data, sharing the buffer of data.
     """
-    for i in range(0, len(data), chunk_size):
-        yield data[i : i + chunk_size]
+    view = memoryview(data)
+    for i in range(0, len(view), chunk_size):
+        yield view[i : i + chunk_size]
+
+
+def _prefetch_chunk_hashes(data_chunks, depth: int = 2):
+    """
+    Hashes chunks on a small thread pool, keeping up to `depth` hashes in flight ahead
+    of the consumer. hashlib releases the GIL on large buffers, so hashing the next
+    chunks overlaps with whatever the consumer does with the current one.
+
+    Yields:
+        tuple: (chunk, chunk_hash) pairs in the original chunk order.
+    """
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=depth) as pool:
+        for chunk in data_chunks:
+            pending.append((chunk, pool.submit(hash_data, chunk)))
+            if len(pending) > depth:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+        while pending:
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
 
 
 def generate_file_size_with_lognormal(
@@ -91,17 +118,21 @@ def make_random_file(name: str = None, maxsize: int = None) -> Union[bytes, str]
         OSError: If the function encounters an error while writing to the file.
     """
     size = (
-        random.randint(random.randint(24, 128), maxsize)
+        pyrandom.randint(pyrandom.randint(24, 128), maxsize)
         if maxsize is not None
         else generate_file_size_with_lognormal()
     )
-    data = os.urandom(size)
     if isinstance(name, str):
+        # Stream the random data in bounded blocks rather than holding it all in memory
         with open(name, "wb") as fout:
-            fout.write(data)
+            remaining = size
+            while remaining > 0:
+                block_size = min(RANDOM_FILE_BLOCK_SIZE, remaining)
+                fout.write(os.urandom(block_size))
+                remaining -= block_size
         return name  # Return filepath of saved data
     else:
-        return data  # Return the data itself
+        return os.urandom(size)  # Return the data itself
 
 
 # Determine a random chunksize between 512kb (random sample from this range) store as chunksize_E
@@ -118,7 +149,7 @@ def get_random_chunksize(minsize: int = 128, maxsize: int = 1024) -> int:
     Raises:
         ValueError: If maxsize is set to a value less than 2.
     """
-    return random.randint(minsize, maxsize)
+    return pyrandom.randint(minsize, maxsize)
 
 
 def check_uid_availability(
@@ -143,27 +174,88 @@ def check_uid_availability(
     return True
 
 
+def _snapshot_metagraph(metagraph: "bt.metagraph.Metagraph") -> SimpleNamespace:
+    """Snapshot the metagraph fields used for uid selection as plain Python/NumPy values.
+    Args:
+        metagraph (:obj: bt.metagraph.Metagraph): Metagraph object
+    Returns:
+        SimpleNamespace: n, uids, S, vpermit and hotkeys of the metagraph
+    """
+    return SimpleNamespace(
+        n=int(metagraph.n),
+        uids=np.asarray(metagraph.uids),
+        S=np.asarray(metagraph.S),
+        vpermit=np.asarray(metagraph.validator_permit, dtype=bool),
+        hotkeys=list(metagraph.hotkeys),
+    )
+
+
+def _available_uids_mask(
+    metagraph: "bt.metagraph.Metagraph", vpermit_tao_limit: int
+) -> np.ndarray:
+    """Vectorized form of check_uid_availability over every uid in the metagraph.
+    Args:
+        metagraph (:obj: bt.metagraph.Metagraph): Metagraph object
+        vpermit_tao_limit (int): Validator permit tao limit
+    Returns:
+        np.ndarray: Boolean mask indexed by uid, True where the uid is available
+    """
+    # Only the stake and permit arrays are needed, so skip the full snapshot.
+    stake = np.asarray(metagraph.S)
+    vpermit = np.asarray(metagraph.validator_permit, dtype=bool)
+    # Axons are Python objects, so the serving flags need one pass to collect.
+    serving = np.array([axon.is_serving for axon in metagraph.axons], dtype=bool)
+    # Filter non serving axons and validator permit > vpermit_tao_limit stake.
+    return serving & ~(vpermit & (stake > vpermit_tao_limit))
+
+
+# Separates positional from keyword arguments in ttl_cache keys
+_KWARGS_MARK = object()
+
+
 def ttl_cache(maxsize=128, ttl=10):
-    """A simple TTL cache decorator for functions with a single argument."""
+    """
+    A TTL cache decorator where every entry expires ttl seconds after it was computed.
+
+    Entries are keyed on the call arguments, which must be hashable. Once maxsize entries
+    are held, the least recently stored entry is evicted.
+    """
 
     def wrapper_cache(func):
-        cache = functools.lru_cache(maxsize=maxsize)(func)
-        last_time = time.time()
+        cache = {}  # key -> (value, expiry on the monotonic clock)
+        # Bind the lookups used on every call as closure locals
+        cache_get = cache.__getitem__
+        cache_pop = cache.pop
+        monotonic = time.monotonic
 
         @functools.wraps(func)
         def wrapped_func(*args, **kwargs):
-            nonlocal last_time
-            current_time = time.time()
-            if current_time - last_time > ttl:
-                cache.cache_clear()
-                last_time = current_time
-            return cache(*args, **kwargs)
-
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            now = monotonic()
+            try:
+                value, expiry = cache_get(key)
+                if expiry > now:
+                    return value
+            except KeyError:
+                pass
+
+            value = func(*args, **kwargs)
+            # Re-insert so that dict order tracks the most recently stored entries
+            cache_pop(key, None)
+            cache[key] = (value, now + ttl)
+            if len(cache) > maxsize:
+                del cache[next(iter(cache))]
+            return value
+
+        wrapped_func.cache_clear = cache.clear
         return wrapped_func
 
     return wrapper_cache
 
 
+@ttl_cache(ttl=12)
 def current_block_hash(self):
     """
     Get the current block hash with caching.
@@ -180,7 +272,14 @@ def current_block_hash(self):
             return block_hash
     except Exception as e:
         bt.logging.warning(f"Failed to get block hash: {e}. Returning a random hash value.")
-    return int(str(random.randint(2 << 32, 2 << 64)))
+    return hex(random.randint(2 << 32, 2 << 64))
+
+
+@functools.lru_cache(maxsize=16)
+def _block_seed(block_hash: str) -> int:
+    # Parse each block hash once rather than on every call for the same block
+    return int(block_hash, 16)
+
 
 def get_block_seed(self):
     """
@@ -192,9 +291,9 @@ def get_block_seed(self):
     Returns:
         int: The block seed.
     """
-    block_hash = current_block_hash(self)
-    bt.logging.trace(f"block hash in get_block_seed: {block_hash}")
-    return int(block_hash, 16)
+    block_seed = _block_seed(current_block_hash(self))
+    bt.logging.trace(f"block seed in get_block_seed: {block_seed}")
+    return block_seed
 
 
 def get_pseudorandom_uids(self, uids, k):
@@ -208,13 +307,12 @@ def get_pseudorandom_uids(self, uids, k):
     Returns:
         list: A list of pseudorandom uids.
     """
-    block_seed = get_block_seed(self)
-    pyrandom.seed(block_seed)
+    rng = pyrandom.Random(get_block_seed(self))
 
     # Ensure k is not larger than the number of uids
     k = min(k, len(uids))
 
-    sampled = pyrandom.sample(uids, k=k)
+    sampled = rng.sample(uids, k=k)
     bt.logging.debug(f"get_pseudorandom_uids() sampled: {k} | {sampled}")
     return sampled
 
@@ -225,18 +323,25 @@ def get_available_uids(self, exclude: list = None):
     Returns:
         uids (torch.LongTensor): All available uids.
     """
-    avail_uids = []
-
-    for uid in range(self.metagraph.n.item()):
-        uid_is_available = check_uid_availability(
-            self.metagraph, uid, self.config.neuron.vpermit_tao_limit
-        )
-        if uid_is_available and (exclude is None or uid not in exclude):
-            avail_uids.append(uid)
+    # The metagraph only changes when it is synced, so reuse the result for its block
+    avail_uids = _get_available_uids_at_block(self, int(self.metagraph.block))
+    if exclude:
+        exclude_set = frozenset(exclude)
+        avail_uids = [uid for uid in avail_uids if uid not in exclude_set]
+    else:
+        avail_uids = list(avail_uids)
     bt.logging.debug(f"returning available uids: {avail_uids}")
     return avail_uids
 
 
+@ttl_cache(maxsize=8, ttl=12)
+def _get_available_uids_at_block(self, block: int) -> tuple:
+    avail_mask = _available_uids_mask(
+        self.metagraph, self.config.neuron.vpermit_tao_limit
+    )
+    return tuple(np.flatnonzero(avail_mask).tolist())
+
+
 # TODO: update this to use the block hash seed paradigm so that we don't get uids that are unavailable
 def get_random_uids(
     self, k: int, exclude: List[int] = None, seed: int = None
@@ -250,34 +355,23 @@ def get_random_uids(
     Notes:
         If `k` is larger than the number of available `uids`, set `k` to the number of available `uids`.
     """
-    candidate_uids = []
-    avail_uids = []
+    avail_mask = _available_uids_mask(
+        self.metagraph, self.config.neuron.vpermit_tao_limit
+    )
 
-    for uid in range(self.metagraph.n.item()):
-        uid_is_available = check_uid_availability(
-            self.metagraph, uid, self.config.neuron.vpermit_tao_limit
-        )
-        uid_is_not_excluded = exclude is None or uid not in exclude
-
-        if uid_is_available and uid_is_not_excluded:
-            candidate_uids.append(uid)
-        elif uid_is_available:
-            avail_uids.append(uid)
-
-    # If not enough candidate_uids, supplement from avail_uids, ensuring they're not in exclude list
-    if len(candidate_uids) < k:
-        additional_uids_needed = k - len(candidate_uids)
-        filtered_avail_uids = [uid for uid in avail_uids if uid not in exclude]
-        additional_uids = random.sample(
-            filtered_avail_uids, min(additional_uids_needed, len(filtered_avail_uids))
-        )
-        candidate_uids.extend(additional_uids)
+    # Candidates are the available uids that are not excluded, in a single masked pass
+    excluded_mask = np.zeros(avail_mask.shape, dtype=bool)
+    if exclude:
+        excluded_mask[
+            [uid for uid in frozenset(exclude) if 0 <= uid < len(excluded_mask)]
+        ] = True
+    candidate_uids = np.flatnonzero(avail_mask & ~excluded_mask).tolist()
 
     # Safeguard against trying to sample more than what is available
     num_to_sample = min(k, len(candidate_uids))
-    if seed:  # use block hash seed if provided
-        random.seed(seed)
-    uids = random.sample(candidate_uids, num_to_sample)
+    # Use a block hash seeded generator if provided, the module's secure one otherwise
+    rng = pyrandom.Random(seed) if seed else random
+    uids = rng.sample(candidate_uids, num_to_sample)
     bt.logging.debug(f"returning available uids: {uids}")
     return uids
 
@@ -322,19 +416,22 @@ def get_all_validators(self, return_hotkeys=False):
     Returns:
         list: A list of validator UIDs or hotkeys, depending on the value of return_hotkeys.
     """
+    # The metagraph only changes when it is synced, so reuse the result for its block
+    return list(
+        _get_all_validators_at_block(self, int(self.metagraph.block), return_hotkeys)
+    )
+
+
+@ttl_cache(maxsize=8, ttl=12)
+def _get_all_validators_at_block(self, block: int, return_hotkeys: bool) -> tuple:
     # Determine validator axons to query from metagraph
-    vpermits = self.metagraph.validator_permit
-    vpermit_uids = [uid for uid, permit in enumerate(vpermits) if permit]
-    vpermit_uids = torch.where(vpermits)[0]
-    query_idxs = torch.where(
-        self.metagraph.S[vpermit_uids] > self.config.neuron.vpermit_tao_limit
-    )[0]
-    query_uids = vpermit_uids[query_idxs].tolist()
+    snapshot = _snapshot_metagraph(self.metagraph)
+    query_uids = np.flatnonzero(
+        snapshot.vpermit & (snapshot.S > self.config.neuron.vpermit_tao_limit)
+    ).tolist()
 
-    return (
-        [self.metagraph.hotkeys[uid] for uid in query_uids]
-        if return_hotkeys
-        else query_uids
+    return tuple(
+        [snapshot.hotkeys[uid] for uid in query_uids] if return_hotkeys else query_uids
     )
 
 
@@ -345,25 +442,44 @@ def get_all_miners(self):
     Returns:
         list: A list of UIDs of miners.
     """
+    # The metagraph only changes when it is synced, so reuse the result for its block
+    return list(_get_all_miners_at_block(self, int(self.metagraph.block)))
+
+
+@ttl_cache(maxsize=8, ttl=12)
+def _get_all_miners_at_block(self, block: int) -> tuple:
     # Determine miner axons to query from metagraph
-    vuids = get_all_validators(self)
-    return [uid for uid in self.metagraph.uids.tolist() if uid not in vuids]
+    uids = np.asarray(self.metagraph.uids)
+    vuids = np.asarray(get_all_validators(self), dtype=uids.dtype)
+    return tuple(np.setdiff1d(uids, vuids, assume_unique=True).tolist())
 
 
-def get_query_miners(self, k=20, exlucde=None):
+def get_query_miners(self, k=20, exclude=None, exlucde=None):
     """
     Obtain a list of miner UIDs selected pseudorandomly based on the current block hash.
 
     Args:
         k (int): The number of miner UIDs to retrieve.
+        exclude (list, optional): Miner UIDs to leave out of the selection.
+        exlucde (list, optional): Deprecated misspelling of `exclude`.
 
     Returns:
         list: A list of pseudorandomly selected miner UIDs.
     """
+    if exlucde is not None:
+        warnings.warn(
+            "get_query_miners(exlucde=...) is deprecated, use exclude=... instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if exclude is None:
+            exclude = exlucde
+
     # Determine miner axons to query from metagraph with pseudorandom block_hash seed
     muids = get_all_miners(self)
-    if exlucde is not None:
-        muids = [muid for muid in muids if muid not in exlucde]
+    if exclude:
+        exclude_set = frozenset(exclude)
+        muids = [muid for muid in muids if muid not in exclude_set]
     return get_pseudorandom_uids(self, muids, k=k)
 
 
@@ -389,6 +505,8 @@ async def get_available_query_miners(
 
     Args:
         k (int): The number of available miner UIDs to retrieve.
+        exclude (List[int], optional): Miner UIDs to leave out of the selection.
+        exclude_full (bool): If True, also leave out miners whose hotkeys are at capacity.
 
     Returns:
         list: A list of pseudorandomly selected available miner UIDs.
@@ -397,12 +515,15 @@ async def get_available_query_miners(
     muids = get_available_uids(self, exclude=exclude)
     bt.logging.debug(f"get_available_query_miners() available uids: {muids}")
     if exclude_full:
-        muids_nonfull = [
-            uid
-            for uid in muids
-            if not await hotkey_at_capacity(self.metagraph.hotkeys[uid], self.database)
-        ]
-        bt.logging.debug(f"available uids nonfull: {muids_nonfull}")
+        # Check every hotkey's capacity concurrently rather than one round trip at a time
+        at_capacity = await asyncio.gather(
+            *(
+                hotkey_at_capacity(self.metagraph.hotkeys[uid], self.database)
+                for uid in muids
+            )
+        )
+        muids = [uid for uid, full in zip(muids, at_capacity) if not full]
+        bt.logging.debug(f"available uids nonfull: {muids}")
     return get_pseudorandom_uids(self, muids, k=k)
 
 
@@ -413,10 +534,9 @@ def get_current_validator_uid_pseudorandom(self):
     Returns:
         int: A pseudorandomly selected validator UID.
     """
-    block_seed = get_block_seed(self)
-    pyrandom.seed(block_seed)
+    rng = pyrandom.Random(get_block_seed(self))
     vuids = get_query_validators(self)
-    return pyrandom.choice(vuids)
+    return rng.choice(vuids)
 
 
 def get_current_validtor_uid_round_robin(self):
@@ -431,40 +551,48 @@ def get_current_validtor_uid_round_robin(self):
     return vuids[vidx]
 
 
-def generate_efficient_combinations(available_uids, R):
+def sample_unique_combinations(available_uids, R, rng=pyrandom):
     """
-    Generates all possible combinations of UIDs for a given redundancy factor.
+    Lazily yields distinct combinations of UIDs for a given redundancy factor in random order,
+    without materializing every possible combination up front.
 
     Args:
         available_uids (list): A list of UIDs that are available for storing data.
         R (int): The redundancy factor specifying the number of UIDs to be used for each chunk of data.
+        rng (random.Random, optional): The random number generator to draw combinations with.
 
-    Returns:
-        list: A list of tuples, where each tuple contains a combination of UIDs.
+    Yields:
+        tuple: A combination of R UIDs, ordered as they appear in available_uids.
 
     Raises:
         ValueError: If the redundancy factor is greater than the number of available UIDs.
     """
-
-    if R > len(available_uids):
+    num_uids = len(available_uids)
+    if R > num_uids:
         raise ValueError(
             "Redundancy factor cannot be greater than the number of available UIDs."
         )
 
-    # Generate all combinations of available UIDs for the redundancy factor
-    uid_combinations = list(combinations(available_uids, R))
-
-    return uid_combinations
+    # Rejection sample index combinations until every combination has been drawn
+    total_combinations = math.comb(num_uids, R)
+    seen_combinations = set()
+    while len(seen_combinations) < total_combinations:
+        idxs = tuple(sorted(rng.sample(range(num_uids), R)))
+        if idxs in seen_combinations:
+            continue
+        seen_combinations.add(idxs)
+        yield tuple(available_uids[i] for i in idxs)
 
 
-def assign_combinations_to_hashes_by_block_hash(self, hashes, combinations):
+def assign_combinations_to_hashes_by_block_hash(self, hashes, available_uids, R):
     """
     Assigns combinations of UIDs to each data chunk hash based on a pseudorandom seed derived from the blockchain's current block hash.
 
     Args:
         subtensor: The subtensor instance used to obtain the current block hash for pseudorandom seed generation.
         hashes (list): A list of hashes, where each hash represents a unique data chunk.
-        combinations (list): A list of UID combinations, where each combination is a tuple of UIDs.
+        available_uids (list): A list of UIDs that are available for storing data.
+        R (int): The redundancy factor specifying the number of UIDs to be used for each chunk of data.
 
     Returns:
         dict: A dictionary mapping each chunk hash to a pseudorandomly selected combination of UIDs.
@@ -472,26 +600,22 @@ def assign_combinations_to_hashes_by_block_hash(self, hashes, combinations):
     Raises:
         ValueError: If there are not enough unique UID combinations for the number of data chunk hashes.
     """
-
-    if len(hashes) > len(combinations):
-        raise ValueError(
-            "Not enough unique UID combinations for the given redundancy factor and number of hashes."
-        )
-    block_seed = get_block_seed(self)
-    pyrandom.seed(block_seed)
-
-    # Shuffle once and then iterate in order for assignment
-    pyrandom.shuffle(combinations)
-    return {hash_val: combinations[i] for i, hash_val in enumerate(hashes)}
+    rng = pyrandom.Random(get_block_seed(self))
+    return assign_combinations_to_hashes(hashes, available_uids, R, rng=rng)
 
 
-def assign_combinations_to_hashes(hashes, combinations):
+def assign_combinations_to_hashes(hashes, available_uids, R, rng=pyrandom):
     """
     Assigns combinations of UIDs to each data chunk hash in a pseudorandom manner.
 
+    Only as many combinations as there are hashes are drawn, rather than building and
+    shuffling every possible combination of the available UIDs.
+
     Args:
         hashes (list): A list of hashes, where each hash represents a unique data chunk.
-        combinations (list): A list of UID combinations, where each combination is a tuple of UIDs.
+        available_uids (list): A list of UIDs that are available for storing data.
+        R (int): The redundancy factor specifying the number of UIDs to be used for each chunk of data.
+        rng (random.Random, optional): The random number generator to draw combinations with.
 
     Returns:
         dict: A dictionary mapping each chunk hash to a pseudorandomly selected combination of UIDs.
@@ -500,14 +624,13 @@ def assign_combinations_to_hashes(hashes, combinations):
         ValueError: If there are not enough unique UID combinations for the number of data chunk hashes.
     """
 
-    if len(hashes) > len(combinations):
+    if R <= len(available_uids) and len(hashes) > math.comb(len(available_uids), R):
         raise ValueError(
             "Not enough unique UID combinations for the given redundancy factor and number of hashes."
         )
 
-    # Shuffle once and then iterate in order for assignment
-    pyrandom.shuffle(combinations)
-    return {hash_val: combinations[i] for i, hash_val in enumerate(hashes)}
+    uid_combinations = sample_unique_combinations(available_uids, R, rng=rng)
+    return {hash_val: next(uid_combinations) for hash_val in hashes}
 
 
 def optimal_chunk_size(
@@ -590,21 +713,24 @@ def compute_chunk_distribution(
     # Ensure chunk size is not larger than data size
     if chunk_size > data_size:
         chunk_size = data_size
-    uid_combinations = generate_efficient_combinations(available_uids, R)
 
     # Create a generator for chunking the data
     data_chunks = chunk_data_generator(data, chunk_size)
 
-    # Use multiprocessing to process chunks in parallel
+    # Draw unique UID combinations pseudorandomly from the block seed as they are needed
     block_seed = get_block_seed(self)
-
-    # Pre-shuffle the UID combinations
-    pyrandom.seed(block_seed)
-    pyrandom.shuffle(uid_combinations)
+    uid_combinations = sample_unique_combinations(
+        available_uids, R, rng=pyrandom.Random(block_seed)
+    )
 
     # Process each chunk and yield it's distribution of UIDs
-    for i, chunk in enumerate(data_chunks):
-        yield {hash_data(chunk): {"chunk": chunk, "uids": uid_combinations[i]}}
+    for chunk, chunk_hash in _prefetch_chunk_hashes(data_chunks):
+        uids = next(uid_combinations, None)
+        if uids is None:
+            raise ValueError(
+                "Not enough unique UID combinations for the given redundancy factor and number of chunks."
+            )
+        yield {chunk_hash: {"chunk": chunk, "uids": uids}}
 
 
 def partition_uids(available_uids, R):
@@ -616,9 +742,11 @@ def partition_uids(available_uids, R):
         R (int): Size of each group (redundancy factor).
 
     Returns:
-        list of tuples: A list where each tuple contains a unique group of UIDs.
+        np.ndarray: An array of shape (len(available_uids) // R, R) where each row is a
+                    unique group of UIDs. len(available_uids) must be a multiple of R
+                    (see adjust_uids_to_multiple).
     """
-    return [tuple(available_uids[i : i + R]) for i in range(0, len(available_uids), R)]
+    return np.asarray(available_uids, dtype=np.int64).reshape(-1, R)
 
 
 def adjust_uids_to_multiple(available_uids, R):
@@ -680,20 +808,18 @@ async def compute_chunk_distribution_mut_exclusive_numpy_reuse_uids_yield(
 
     # Create initial UID groups
     initial_uid_groups = partition_uids(available_uids, R)
-    uid_groups = list(initial_uid_groups)
 
-    # If more groups are needed, start reusing UIDs
-    total_chunks_needed = data_size // chunk_size
-    while len(uid_groups) < total_chunks_needed:
-        for group in cycle(initial_uid_groups):
-            if len(uid_groups) >= total_chunks_needed:
-                break
-            uid_groups.append(group)
+    # If more groups are needed, start reusing UIDs (including the tail chunk)
+    total_chunks_needed = -(-data_size // chunk_size)
+    reps = -(-total_chunks_needed // len(initial_uid_groups))
+    # Convert all groups to python lists at once rather than row by row
+    uid_groups = np.tile(initial_uid_groups, (reps, 1))[:total_chunks_needed].tolist()
 
     data_chunks = chunk_data_generator(data, chunk_size)
-    for chunk, uid_group in zip(data_chunks, uid_groups):
-        chunk_hash = hash_data(chunk)
-        yield {"chunk_hash": chunk_hash, "chunk": chunk, "uids": uid_group.tolist()}
+    for (chunk, chunk_hash), uid_group in zip(
+        _prefetch_chunk_hashes(data_chunks), uid_groups
+    ):
+        yield {"chunk_hash": chunk_hash, "chunk": chunk, "uids": uid_group}
 
 
 def calculate_chunk_indices(data_size, chunk_size):
@@ -704,19 +830,9 @@ def calculate_chunk_indices(data_size, chunk_size):
     :param chunk_size: The chunk size.
     :return: A list of tuples, each tuple containing the start and end index of a chunk.
     """
-    indices = []
-    num_chunks = math.ceil(data_size / chunk_size)
-
-    for i in range(num_chunks):
-        start_idx = i * chunk_size
-        end_idx = min(start_idx + chunk_size, data_size)
-        indices.append((start_idx, end_idx))
-
-        # Adjust the end index for the last chunk if necessary
-        if i == num_chunks - 1 and end_idx < data_size:
-            indices[-1] = (start_idx, data_size)
-
-    return indices
+    starts = np.arange(0, data_size, chunk_size, dtype=np.int64)
+    ends = np.minimum(starts + chunk_size, data_size)
+    return list(zip(starts.tolist(), ends.tolist()))
 
 
 def calculate_chunk_indices_from_num_chunks(data_size, num_chunks):
@@ -728,18 +844,14 @@ def calculate_chunk_indices_from_num_chunks(data_size, num_chunks):
     :return: A list of tuples, each tuple containing the start and end index of a chunk.
     """
     chunk_size = max(1, data_size // num_chunks)  # Determine the size of each chunk
-    indices = []
-
-    for i in range(num_chunks):
-        start_idx = i * chunk_size
-        end_idx = min(start_idx + chunk_size, data_size)
-        indices.append((start_idx, end_idx))
+    starts = np.arange(num_chunks, dtype=np.int64) * chunk_size
+    ends = np.minimum(starts + chunk_size, data_size)
 
-        # Adjust the end index for the last chunk if necessary
-        if i == num_chunks - 1 and end_idx < data_size:
-            indices[-1] = (start_idx, data_size)
+    # The last chunk absorbs the remainder of the data
+    if num_chunks > 0:
+        ends[-1] = data_size
 
-    return indices
+    return list(zip(starts.tolist(), ends.tolist()))
 
 
 async def compute_chunk_distribution_mut_exclusive_numpy_reuse_uids(
@@ -784,15 +896,14 @@ async def compute_chunk_distribution_mut_exclusive_numpy_reuse_uids(
 
     # Create initial UID groups
     initial_uid_groups = partition_uids(available_uids, R)
-    uid_groups = list(initial_uid_groups)
-
-    # If more groups are needed, start reusing UIDs
-    total_chunks_needed = data_size // chunk_size
-    while len(uid_groups) < total_chunks_needed:
-        for group in cycle(initial_uid_groups):
-            if len(uid_groups) >= total_chunks_needed:
-                break
-            uid_groups.append(group)
+
+    # If more groups are needed, start reusing UIDs (including the tail chunk)
+    total_chunks_needed = -(-data_size // chunk_size)
+    reps = -(-total_chunks_needed // len(initial_uid_groups))
+    # Convert all groups to python tuples at once rather than row by row
+    uid_groups = map(
+        tuple, np.tile(initial_uid_groups, (reps, 1))[:total_chunks_needed].tolist()
+    )
 
     for i, ((start, end), uid_group) in enumerate(zip(chunk_indices, uid_groups)):
         yield {
@@ -1,6 +1,9 @@
-from unittest import TestCase
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, patch
 
-from storage.validator.challenge import _filter_verified_responses
+from storage import protocol
+from storage.validator.challenge import _filter_verified_responses, challenge_data
 
 
 class TestChallenge(TestCase):
@@ -29,3 +32,49 @@ class TestChallenge(TestCase):
 
         self.assertEqual((19, 14, 9), uids)
         self.assertEqual((1, 4, 7), responses)
+
+
+class TestChallengeData(IsolatedAsyncioTestCase):
+    async def test_challenge_data_with_dummy_and_timed_out_responses(self):
+        dummy = protocol.Challenge(
+            challenge_hash="",
+            chunk_size=0,
+            g="",
+            h="",
+            curve="",
+            challenge_index=0,
+            seed="",
+        )
+        timed_out = dummy.copy()
+        neuron = SimpleNamespace(
+            subtensor=SimpleNamespace(get_current_block=lambda: 1),
+            device="cpu",
+            config=SimpleNamespace(
+                neuron=SimpleNamespace(verbose=False, log_responses=False)
+            ),
+            metagraph=SimpleNamespace(hotkeys=["hotkey0", "hotkey1"]),
+            database=None,
+        )
+        handle_challenge = AsyncMock(
+            side_effect=[(None, [dummy]), (False, [timed_out])]
+        )
+
+        with patch(
+            "storage.validator.challenge.get_available_query_miners",
+            AsyncMock(return_value=[0, 1]),
+        ), patch(
+            "storage.validator.challenge.handle_challenge", handle_challenge
+        ), patch(
+            "storage.validator.challenge.update_statistics", AsyncMock()
+        ), patch(
+            "storage.validator.challenge.get_tier_factor", AsyncMock(return_value=1.0)
+        ), patch(
+            "storage.validator.challenge.apply_reward_scores"
+        ) as apply_reward_scores:
+            event = await challenge_data(neuron)
+
+        self.assertEqual([1], event.uids)
+        self.assertEqual([False], event.successful)
+        self.assertEqual(
+            [0], apply_reward_scores.call_args.kwargs["data_sizes"].tolist()
+        )
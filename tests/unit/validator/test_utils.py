@@ -0,0 +1,337 @@
+import torch
+import random
+from itertools import combinations
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, Mock, patch
+
+from storage.shared.ecc import hash_data
+from storage.validator.utils import (
+    _available_uids_mask,
+    _prefetch_chunk_hashes,
+    assign_combinations_to_hashes,
+    calculate_chunk_indices,
+    calculate_chunk_indices_from_num_chunks,
+    check_uid_availability,
+    chunk_data_generator,
+    compute_chunk_distribution_mut_exclusive_numpy_reuse_uids,
+    get_all_miners,
+    get_all_validators,
+    get_available_uids,
+    get_available_query_miners,
+    get_block_seed,
+    get_pseudorandom_uids,
+    get_query_miners,
+    partition_uids,
+    sample_unique_combinations,
+    ttl_cache,
+)
+
+
+def make_metagraph(serving, validator_permit, stake):
+    return SimpleNamespace(
+        block=torch.tensor(1),
+        n=torch.tensor(len(serving)),
+        uids=torch.arange(len(serving)),
+        hotkeys=[f"hotkey{uid}" for uid in range(len(serving))],
+        axons=[SimpleNamespace(is_serving=is_serving) for is_serving in serving],
+        validator_permit=torch.tensor(validator_permit),
+        S=torch.tensor(stake, dtype=torch.float32),
+    )
+
+
+class Neuron:
+    # Unlike SimpleNamespace this is hashable, so ttl_cache can key on it
+    pass
+
+
+def make_neuron(metagraph=None, subtensor=None):
+    neuron = Neuron()
+    neuron.config = SimpleNamespace(neuron=SimpleNamespace(vpermit_tao_limit=500))
+    neuron.metagraph = metagraph
+    neuron.subtensor = subtensor
+    return neuron
+
+
+class TestTtlCache(TestCase):
+    def test_ttl_cache_expires_entries_individually(self):
+        calls = []
+
+        with patch("storage.validator.utils.time.monotonic") as monotonic:
+
+            @ttl_cache(maxsize=8, ttl=10)
+            def double(x):
+                calls.append(x)
+                return x * 2
+
+            monotonic.return_value = 100
+            self.assertEqual(2, double(1))
+            monotonic.return_value = 105
+            self.assertEqual(4, double(2))
+
+            # Only the entry stored at t=100 has expired
+            monotonic.return_value = 111
+            self.assertEqual(2, double(1))
+            self.assertEqual(4, double(2))
+
+        self.assertEqual([1, 2, 1], calls)
+
+    def test_ttl_cache_evicts_oldest_entry_at_maxsize(self):
+        calls = []
+
+        @ttl_cache(maxsize=2, ttl=60)
+        def identity(x):
+            calls.append(x)
+            return x
+
+        identity(1)
+        identity(2)
+        identity(3)
+        identity(2)
+        identity(1)
+
+        self.assertEqual([1, 2, 3, 1], calls)
+
+
+class TestAvailableUids(TestCase):
+    def test_available_uids_mask_matches_check_uid_availability(self):
+        metagraph = make_metagraph(
+            serving=[True, True, False, True, True],
+            validator_permit=[False, True, False, True, True],
+            stake=[10.0, 5000.0, 0.0, 100.0, 500.0],
+        )
+
+        mask = _available_uids_mask(metagraph, vpermit_tao_limit=500)
+
+        expected = [check_uid_availability(metagraph, uid, 500) for uid in range(5)]
+        self.assertEqual(expected, mask.tolist())
+        self.assertEqual([True, False, False, True, True], mask.tolist())
+
+    def test_get_available_uids_reuses_mask_for_metagraph_block(self):
+        neuron = make_neuron(
+            metagraph=make_metagraph(
+                serving=[True, True, False, True, True],
+                validator_permit=[False, True, False, True, True],
+                stake=[10.0, 5000.0, 0.0, 100.0, 500.0],
+            )
+        )
+
+        self.assertEqual([0, 3, 4], get_available_uids(neuron))
+        with patch("storage.validator.utils._available_uids_mask") as mask:
+            self.assertEqual([0, 4], get_available_uids(neuron, exclude=[3]))
+            mask.assert_not_called()
+
+
+class TestGetAllValidators(TestCase):
+    def test_get_all_validators_is_reused_until_the_metagraph_block_changes(self):
+        neuron = make_neuron(
+            metagraph=make_metagraph(
+                serving=[True] * 3,
+                validator_permit=[True, True, False],
+                stake=[10.0, 5000.0, 5000.0],
+            )
+        )
+
+        self.assertEqual([1], get_all_validators(neuron))
+        self.assertEqual(["hotkey1"], get_all_validators(neuron, return_hotkeys=True))
+
+        with patch("storage.validator.utils._snapshot_metagraph") as snapshot:
+            self.assertEqual([1], get_all_validators(neuron))
+            snapshot.assert_not_called()
+
+        neuron.metagraph.block = torch.tensor(2)
+        neuron.metagraph.S = torch.tensor([5000.0, 5000.0, 5000.0])
+        self.assertEqual([0, 1], get_all_validators(neuron))
+
+
+class TestGetAllMiners(TestCase):
+    def test_get_all_miners_excludes_validators_and_caches_per_block(self):
+        neuron = make_neuron(
+            metagraph=make_metagraph(
+                serving=[True] * 5,
+                validator_permit=[False, True, False, True, True],
+                stake=[10.0, 5000.0, 0.0, 100.0, 500.0],
+            )
+        )
+
+        self.assertEqual([0, 2, 3, 4], get_all_miners(neuron))
+
+        # A resynced metagraph at a new block is not served from the cache
+        neuron.metagraph.block = torch.tensor(2)
+        neuron.metagraph.S = torch.tensor([10.0, 5000.0, 0.0, 100.0, 5000.0])
+        self.assertEqual([0, 2, 3], get_all_miners(neuron))
+
+
+class TestBlockSeed(TestCase):
+    def test_get_block_seed_parses_block_hash_once(self):
+        neuron = make_neuron(
+            subtensor=SimpleNamespace(
+                get_current_block=lambda: 7,
+                get_block_hash=Mock(return_value="0x" + "ab" * 32),
+            )
+        )
+
+        self.assertEqual(int("ab" * 32, 16), get_block_seed(neuron))
+        self.assertEqual(int("ab" * 32, 16), get_block_seed(neuron))
+        neuron.subtensor.get_block_hash.assert_called_once_with(7)
+
+    def test_get_block_seed_falls_back_to_random_seed(self):
+        neuron = make_neuron(
+            subtensor=SimpleNamespace(
+                get_current_block=Mock(side_effect=RuntimeError("unreachable"))
+            )
+        )
+
+        self.assertIsInstance(get_block_seed(neuron), int)
+
+
+class TestPseudorandomUids(TestCase):
+    @patch("storage.validator.utils.get_block_seed", return_value=1234)
+    def test_get_pseudorandom_uids_leaves_global_random_state(self, _):
+        uids = list(range(50))
+        random.seed(99)
+        expected_next = random.Random(99).random()
+
+        first = get_pseudorandom_uids(None, uids, k=5)
+        second = get_pseudorandom_uids(None, uids, k=5)
+
+        self.assertEqual(random.Random(1234).sample(uids, k=5), first)
+        self.assertEqual(first, second)
+        self.assertEqual(expected_next, random.random())
+
+
+class TestGetQueryMiners(TestCase):
+    @patch("storage.validator.utils.get_block_seed", return_value=1234)
+    @patch("storage.validator.utils.get_all_miners", return_value=[0, 2, 3, 4])
+    def test_get_query_miners_excludes_uids(self, *_):
+        self.assertEqual([0, 4], sorted(get_query_miners(None, k=5, exclude=[2, 3])))
+
+        with self.assertWarns(DeprecationWarning):
+            uids = get_query_miners(None, k=5, exlucde=[2, 3])
+        self.assertEqual([0, 4], sorted(uids))
+
+
+class TestPartitionUids(TestCase):
+    def test_partition_uids_groups_consecutive_uids(self):
+        groups = partition_uids([4, 8, 15, 16, 23, 42], 3)
+
+        self.assertEqual((2, 3), groups.shape)
+        self.assertEqual([[4, 8, 15], [16, 23, 42]], groups.tolist())
+
+
+class TestPrefetchChunkHashes(TestCase):
+    def test_prefetch_chunk_hashes_preserves_order(self):
+        chunks = [bytes([i]) * 4096 for i in range(7)]
+
+        hashed = list(_prefetch_chunk_hashes(iter(chunks), depth=2))
+
+        self.assertEqual([(chunk, hash_data(chunk)) for chunk in chunks], hashed)
+
+
+class TestChunkIndices(TestCase):
+    def test_calculate_chunk_indices_covers_tail(self):
+        self.assertEqual([(0, 4), (4, 8), (8, 10)], calculate_chunk_indices(10, 4))
+        self.assertEqual([], calculate_chunk_indices(0, 4))
+
+    def test_calculate_chunk_indices_is_exact_beyond_float_precision(self):
+        data_size = 2**53 + 3
+        indices = calculate_chunk_indices(data_size, 2**52)
+
+        self.assertEqual((2**53, data_size), indices[-1])
+        self.assertEqual(3, len(indices))
+
+    def test_calculate_chunk_indices_from_num_chunks_extends_last_chunk(self):
+        self.assertEqual(
+            [(0, 3), (3, 6), (6, 10)], calculate_chunk_indices_from_num_chunks(10, 3)
+        )
+
+
+class TestGetAvailableQueryMiners(IsolatedAsyncioTestCase):
+    @patch("storage.validator.utils.get_block_seed", return_value=1234)
+    @patch("storage.validator.utils.get_available_uids", return_value=[0, 1, 2])
+    async def test_exclude_full_drops_miners_at_capacity(self, *_):
+        neuron = SimpleNamespace(
+            database=None, metagraph=SimpleNamespace(hotkeys=["h0", "h1", "h2"])
+        )
+        at_capacity = AsyncMock(side_effect=lambda hotkey, _: hotkey == "h1")
+
+        with patch("storage.validator.utils.hotkey_at_capacity", at_capacity):
+            uids = await get_available_query_miners(neuron, k=5, exclude_full=True)
+
+        self.assertEqual([0, 2], sorted(uids))
+        self.assertEqual(3, at_capacity.await_count)
+
+
+class TestChunkDistribution(IsolatedAsyncioTestCase):
+    async def test_reuse_uids_assigns_groups_to_every_chunk(self):
+        with patch(
+            "storage.validator.utils.get_available_query_miners",
+            AsyncMock(return_value=[1, 2, 3, 4, 5, 6, 7]),
+        ):
+            distributions = [
+                dist
+                async for dist in compute_chunk_distribution_mut_exclusive_numpy_reuse_uids(
+                    None, data_size=1000, R=3, k=7, chunk_size=300
+                )
+            ]
+
+        self.assertEqual(
+            [(0, 300), (300, 600), (600, 900), (900, 1000)],
+            [(dist["start_idx"], dist["end_idx"]) for dist in distributions],
+        )
+        self.assertEqual(
+            [(1, 2, 3), (4, 5, 6), (1, 2, 3), (4, 5, 6)],
+            [dist["uids"] for dist in distributions],
+        )
+
+
+class TestSampleUniqueCombinations(TestCase):
+    def test_sample_unique_combinations_yields_every_combination_once(self):
+        uids = [5, 3, 9, 1, 7]
+
+        sampled = list(sample_unique_combinations(uids, 3, rng=random.Random(42)))
+
+        self.assertEqual(sorted(combinations(uids, 3)), sorted(sampled))
+
+    def test_sample_unique_combinations_is_deterministic_for_seed(self):
+        uids = list(range(20))
+
+        first = sample_unique_combinations(uids, 3, rng=random.Random(7))
+        second = sample_unique_combinations(uids, 3, rng=random.Random(7))
+
+        self.assertEqual(
+            [next(first) for _ in range(10)], [next(second) for _ in range(10)]
+        )
+
+    def test_sample_unique_combinations_rejects_large_redundancy(self):
+        with self.assertRaises(ValueError):
+            next(sample_unique_combinations([1, 2], 3))
+
+
+class TestAssignCombinationsToHashes(TestCase):
+    def test_assign_combinations_to_hashes_assigns_distinct_combinations(self):
+        hashes = ["a", "b", "c", "d"]
+
+        assigned = assign_combinations_to_hashes(
+            hashes, [1, 2, 3, 4], 3, rng=random.Random(3)
+        )
+
+        self.assertEqual(hashes, list(assigned))
+        self.assertEqual(
+            sorted(combinations([1, 2, 3, 4], 3)), sorted(assigned.values())
+        )
+
+    def test_assign_combinations_to_hashes_rejects_too_many_hashes(self):
+        with self.assertRaises(ValueError):
+            assign_combinations_to_hashes(["a", "b", "c", "d", "e"], [1, 2, 3, 4], 3)
+
+
+class TestChunkDataGenerator(TestCase):
+    def test_chunk_data_generator_yields_views_of_data(self):
+        data = b"abcdefghij"
+
+        chunks = list(chunk_data_generator(data, 4))
+
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+        self.assertEqual([b"abcd", b"efgh", b"ij"], [bytes(chunk) for chunk in chunks])
+        self.assertEqual(hash_data(b"efgh"), hash_data(chunks[1]))